@@ -12,19 +12,447 @@ This version contains:
 
 from __future__ import annotations
 
+import os
 import time
 import math
+import pickle
+import random
+import functools
+import itertools
+import threading
+import concurrent.futures as cf
 import datetime as dt
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import List, Dict, Callable, Tuple, Optional
+import numpy as np
+import pandas as pd
 import yfinance as yf
 
+# Optional JIT for the chain kernels
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+try:
+    from zoneinfo import ZoneInfo
+    _ET = ZoneInfo("America/New_York")
+except Exception:
+    # no tz database available (e.g. Windows without tzdata) -> fixed EST offset
+    _ET = dt.timezone(dt.timedelta(hours=-5))
+
+
+# ===============================================================
+#                  OPTION CHAIN DISK CACHE
+# ===============================================================
+
+CHAIN_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "options"
+
+
+def ttl_for_context(now: Optional[dt.datetime] = None) -> float:
+    """
+    How long a cached chain stays fresh, based on the US market clock:
+        - 15s during regular trading hours (9:30-16:00 ET, weekdays)
+        - 4h outside regular hours on weekdays
+        - 24h on weekends
+    """
+    now = now or dt.datetime.now(_ET)
+    if now.weekday() >= 5:
+        return 24 * 3600
+    minutes = now.hour * 60 + now.minute
+    if 9 * 60 + 30 <= minutes < 16 * 60:
+        return 15
+    return 4 * 3600
+
+
+class _ChainCache:
+    """
+    Pickled (calls, puts) column arrays per (ticker, expiry), expired by file age.
+    The most recently used chains are also kept unpickled in memory, so a
+    scan loop polling faster than the TTL does not re-read disk every tick.
+    """
+
+    def __init__(self, root: Path, mem_entries: int = 256):
+        self.root = root
+        self.mem_entries = mem_entries
+        self._mem: "OrderedDict[Tuple[str, str], Tuple[float, Tuple]]" = OrderedDict()
+        self._mem_lock = threading.Lock()
+
+    def _path(self, ticker: str, expiry: str) -> Path:
+        return self.root / ticker.upper() / f"{expiry}.cols.pkl"
+
+    def _remember(self, key: Tuple[str, str], stored_at: float, value: Tuple) -> None:
+        with self._mem_lock:
+            self._mem[key] = (stored_at, value)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.mem_entries:
+                self._mem.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-memory layer (files on disk still expire by age)."""
+        with self._mem_lock:
+            self._mem.clear()
+
+    def get(self, ticker: str, expiry: str) -> Optional[Tuple]:
+        entry = self.get_entry(ticker, expiry)
+        return entry[1] if entry is not None else None
+
+    def get_entry(self, ticker: str, expiry: str) -> Optional[Tuple[float, Tuple]]:
+        """
+        (stored_at, chain) while fresh, else None. stored_at is the same
+        stamp whether the chain comes from memory or disk, so it identifies
+        one fetched version of the chain.
+        """
+        key = (ticker.upper(), expiry)
+        ttl = ttl_for_context()
+        now = time.time()
+        with self._mem_lock:
+            hit = self._mem.get(key)
+            if hit is not None:
+                if now - hit[0] < ttl:
+                    self._mem.move_to_end(key)
+                    return hit
+                del self._mem[key]
+
+        p = self._path(ticker, expiry)
+        try:
+            mtime = p.stat().st_mtime
+            if now - mtime >= ttl:
+                return None
+            with p.open("rb") as f:
+                value = pickle.load(f)
+        except Exception:
+            return None
+        self._remember(key, mtime, value)
+        return mtime, value
+
+    def put(self, ticker: str, expiry: str, chain: Tuple) -> float:
+        """Store `chain`; returns its stored_at stamp (the file's mtime when written)."""
+        stored_at = time.time()
+        p = self._path(ticker, expiry)
+        tmp = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            p.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump(chain, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(p)
+            stored_at = p.stat().st_mtime
+        except Exception:
+            pass
+        self._remember((ticker.upper(), expiry), stored_at, chain)
+        return stored_at
+
+
+_CHAIN_CACHE = _ChainCache(CHAIN_CACHE_DIR)
+
+
+def fetch_option_chain(ticker: str, expiry: str, refresh: bool = False):
+    """
+    Return (calls, puts) for one chain as dicts of NumPy column arrays
+    (see _chain_arrays).
+    Served from the cache while fresh (unless refresh=True); otherwise
+    fetched via yfinance and written back to the cache.
+    Raises whatever yfinance raises on failure.
+    """
+    return fetch_option_chain_entry(ticker, expiry, refresh)[1]
+
+
+def fetch_option_chain_entry(ticker: str, expiry: str, refresh: bool = False):
+    """
+    fetch_option_chain, plus the chain's cache stamp: (stored_at, (calls, puts)).
+    The stamp only changes when the chain is refetched, so callers can
+    detect "unchanged" by comparing stamps without holding on to the chain.
+    """
+    if not refresh:
+        hit = _CHAIN_CACHE.get_entry(ticker, expiry)
+        if hit is not None:
+            return hit
+    raw = _with_backoff(_yf_ticker(ticker).option_chain, expiry)
+    chain = (_chain_arrays(raw.calls), _chain_arrays(raw.puts))
+    return _CHAIN_CACHE.put(ticker, expiry, chain), chain
+
+
+# Shared fetch pool, created on first use and kept for the process lifetime.
+# Fetches are I/O-bound and Yahoo rate-limits long before local resources run
+# out, so the pool stays within 8..16 workers however many engines are running.
+FETCH_WORKERS = min(16, max(8, (os.cpu_count() or 4) * 2))
+_POOL: Optional[cf.ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _fetch_pool() -> cf.ThreadPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = cf.ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="yf-fetch")
+            # Don't let queued fetches hold up interpreter exit. This has to be
+            # a threading exit hook: concurrent.futures joins its workers (and
+            # drains their queue) from one, before plain atexit handlers run.
+            # Hooks run last-registered-first, so this cancel comes first.
+            threading._register_atexit(_POOL.shutdown, wait=False, cancel_futures=True)
+        return _POOL
+
+
+_RATE_LIMIT_ERRORS = tuple(
+    e for e in (getattr(getattr(yf, "exceptions", None), "YFRateLimitError", None),) if e
+)
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    if _RATE_LIMIT_ERRORS and isinstance(exc, _RATE_LIMIT_ERRORS):
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in (429, 503)
+
+
+def _with_backoff(fn: Callable, *args, retries: int = 3, base_delay: float = 0.5):
+    """Call fn(*args), retrying rate-limit failures with jittered exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args)
+        except Exception as exc:
+            if attempt == retries or not _is_rate_limited(exc):
+                raise
+            time.sleep(base_delay * 2 ** attempt * (1 + random.random()))
+
+
+# One yf.Ticker per symbol, shared by every fetch. yfinance already routes all
+# Tickers through a single pooled session; reusing the object also keeps its
+# expiration map, so option_chain(expiry) costs one request instead of two.
+_TICKER_CACHE: Dict[str, "yf.Ticker"] = {}
+_TICKER_LOCK = threading.Lock()
+
+
+def _yf_ticker(symbol: str, fresh: bool = False):
+    """Shared yf.Ticker for `symbol`; fresh=True replaces it (re-reads expiries)."""
+    key = symbol.upper()
+    with _TICKER_LOCK:
+        t = None if fresh else _TICKER_CACHE.get(key)
+        if t is None:
+            t = _TICKER_CACHE[key] = yf.Ticker(symbol)
+        return t
+
+
+# Expiration listings barely change intraday; one lookup per ticker per hour.
+EXPIRY_TTL_SECS = 3600
+_EXPIRY_CACHE: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+_EXPIRY_LOCK = threading.Lock()
+
+
+def fetch_expiries(
+    tickers: List[str],
+    pool: Optional[cf.Executor] = None,
+    refresh: bool = False,
+    ttl: Optional[float] = None,
+) -> Dict[str, Tuple[str, ...]]:
+    """
+    Return {ticker: expiries} for the whole ticker list in one call.
+    Listings are memoized for `ttl` seconds (default EXPIRY_TTL_SECS;
+    refresh=True looks every ticker up again); stale or unseen tickers are
+    looked up concurrently on `pool` when one is given.
+    Tickers whose lookup fails are left out of the result.
+    """
+    if ttl is None:
+        ttl = EXPIRY_TTL_SECS
+    now = time.time()
+    out: Dict[str, Tuple[str, ...]] = {}
+    missing = []
+    with _EXPIRY_LOCK:
+        for tk in tickers:
+            hit = None if refresh else _EXPIRY_CACHE.get(tk.upper())
+            if hit is not None and now - hit[0] < ttl:
+                out[tk] = hit[1]
+            else:
+                missing.append(tk)
+
+    def _one(tk):
+        try:
+            return _with_backoff(lambda: tuple(_yf_ticker(tk, fresh=True).options))
+        except Exception:
+            return None
+
+    results = (pool.map if pool is not None else map)(_one, missing)
+    for tk, expiries in zip(missing, results):
+        if expiries is None:
+            continue
+        with _EXPIRY_LOCK:
+            _EXPIRY_CACHE[tk.upper()] = (now, expiries)
+        out[tk] = expiries
+    return out
+
+
+# Numeric chain columns the engines read; everything else yfinance returns is dropped.
+CHAIN_FLOAT_COLS = ("strike", "lastPrice", "bid", "ask")
+# Quote columns that also get a "has_<name>" bool mask, so display code can
+# tell a missing quote (zero-filled) from a real 0.00 one.
+CHAIN_QUOTE_COLS = ("bid", "ask")
+
+
+def _float_col(df, name: str) -> np.ndarray:
+    """
+    Chain column as float64; missing column, NaN or non-numeric cells read as NaN.
+    Coercion happens here, once per column, so nothing downstream needs
+    per-value float()/try guards.
+    """
+    if name not in df.columns:
+        return np.full(len(df), np.nan)
+    col = df[name]
+    if not pd.api.types.is_numeric_dtype(col):
+        col = pd.to_numeric(col, errors="coerce")
+    return col.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _chain_arrays(df) -> Dict[str, np.ndarray]:
+    """
+    Convert one side of a yfinance chain to plain NumPy columns, once, at
+    the fetch boundary. Engines index these arrays and never touch pandas.
+    Float columns are zero-filled where Yahoo has no value; bid/ask also
+    carry has_bid/has_ask masks marking the cells that were really quoted.
+    contractSymbol is carried as an object array when Yahoo supplies it.
+    """
+    cols = {}
+    for name in CHAIN_FLOAT_COLS:
+        col = _float_col(df, name)
+        if name in CHAIN_QUOTE_COLS:
+            cols[f"has_{name}"] = ~np.isnan(col)
+        cols[name] = np.nan_to_num(col, nan=0.0)
+    if "contractSymbol" in df.columns:
+        cols["contractSymbol"] = df["contractSymbol"].to_numpy(dtype=object)
+    return cols
+
+
+def _strike_index(strikes: np.ndarray) -> Dict[float, int]:
+    """{strike: first row} for one chain side's strike column."""
+    pos: Dict[float, int] = {}
+    for i, s in enumerate(strikes.tolist()):
+        pos.setdefault(s, i)
+    return pos
+
+
+def occ_symbol(ticker: str, expiry: str, kind: str, strike: float) -> str:
+    """OCC-style option symbol as Yahoo spells it, e.g. AAPL240119C00200000."""
+    return f"{ticker.upper()}{expiry.replace('-', '')[2:]}{kind.upper()}{int(round(strike * 1000)):08d}"
+
+
+# ===============================================================
+#                      CHAIN KERNELS
+# ===============================================================
+
+"""
+Per-chain numeric kernels. Each has a plain loop version (compiled with
+Numba when it is installed) and a NumPy version used as the fallback.
+NaN handling matters here (unseen contracts have prev = NaN), so the
+loops are compiled without fastmath.
+"""
+
+def _quote_loop(last, bid, ask):
+    n = last.shape[0]
+    prem = np.empty(n)
+    spread = np.empty(n)
+    for i in range(n):
+        b = bid[i]
+        a = ask[i]
+        mid = (b + a) / 2
+        if last[i] > 0:
+            prem[i] = last[i]
+        elif b > 0 and a > 0:
+            prem[i] = mid
+        else:
+            prem[i] = max(max(b, a), 0.0)
+        if b > 0 and a > b:
+            spread[i] = (a - b) / mid * 100
+        else:
+            spread[i] = 999.0
+    return prem, spread
+
+
+def _choose_premium_vec(last, bid, ask):
+    """Last trade if any, else bid/ask mid when both sides quote, else the better side."""
+    mid = (bid + ask) / 2
+    return np.where(last > 0, last,
+                    np.where((bid > 0) & (ask > 0), mid, np.maximum(np.maximum(bid, ask), 0)))
+
+
+def _spread_pct_vec(bid, ask):
+    """Bid/ask spread as % of mid; 999 when the market is one-sided or crossed."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where((bid > 0) & (ask > bid), (ask - bid) / ((bid + ask) / 2) * 100, 999.0)
+
+
+def _quote_np(last, bid, ask):
+    return _choose_premium_vec(last, bid, ask), _spread_pct_vec(bid, ask)
+
+
+def _choose_premium_scalar(last: float, bid: float, ask: float) -> float:
+    """Single-contract _choose_premium_vec."""
+    if last > 0:
+        return last
+    if bid > 0 and ask > 0:
+        return (bid + ask) / 2
+    return max(bid, ask)
+
+
+def _spread_pct_scalar(bid: float, ask: float) -> float:
+    """Single-contract _spread_pct_vec."""
+    if bid <= 0 or ask <= bid:
+        return 999.0
+    return (ask - bid) / ((bid + ask) / 2) * 100
+
+
+def _drop_loop(new, prev, floor, drop_thresh):
+    n = new.shape[0]
+    drop = np.zeros(n)
+    hit = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        p = prev[i]
+        if p > 0 and new[i] < p:
+            drop[i] = (p - new[i]) / p * 100
+        hit[i] = new[i] <= floor or drop[i] >= drop_thresh
+    return drop, hit
+
+
+def _drop_np(new, prev, floor, drop_thresh):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drop = np.where((prev > 0) & (new < prev), (prev - new) / prev * 100, 0.0)
+    return drop, (new <= floor) | (drop >= drop_thresh)
+
+
+def _spike_loop(new, prev, min_pct, min_abs):
+    n = new.shape[0]
+    pct = np.full(n, np.nan)
+    fire = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        p = prev[i]
+        if p > 0:
+            move = new[i] - p
+            pct[i] = move / p * 100
+            fire[i] = new[i] > 0 and pct[i] >= min_pct and move >= min_abs
+    return pct, fire
+
+
+def _spike_np(new, prev, min_pct, min_abs):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(prev > 0, (new - prev) / prev * 100, np.nan)
+    return pct, (prev > 0) & (new > 0) & (pct >= min_pct) & ((new - prev) >= min_abs)
+
+
+if njit is not None:
+    _quote_kernel = njit(cache=True)(_quote_loop)
+    _drop_kernel = njit(cache=True)(_drop_loop)
+    _spike_kernel = njit(cache=True)(_spike_loop)
+else:
+    _quote_kernel = _quote_np
+    _drop_kernel = _drop_np
+    _spike_kernel = _spike_np
+
 
 # ===============================================================
 #                     SPIKE SCANNER (unchanged)
 # ===============================================================
 
-@dataclass
+@dataclass(slots=True)
 class SpikeConfig:
     tickers: List[str]
     min_pct: float = 20.0       # minimum spike percentage
@@ -33,6 +461,39 @@ class SpikeConfig:
     max_spread_pct: float = 25.0
     exp_filter_days: Optional[int] = None
     cooldown_secs: int = 20
+    kind: str = "both"          # "both", "C" (calls only) or "P" (puts only)
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_to_date(s: str) -> dt.date:
+    """Parse a YYYY-MM-DD expiry; the same few strings recur every sweep."""
+    return dt.date.fromisoformat(s)
+
+
+def _compile_exp_filter(days: Optional[int]) -> Callable[[Tuple[str, ...]], List[str]]:
+    """
+    Build the exp_filter_days check once per config. The returned function
+    maps one ticker's expiries to those worth scanning: only exp ≤ X days.
+    Whole days are counted from now, so the last accepted date is today + X + 1.
+    """
+    if not days:
+        return list
+
+    span = dt.timedelta(days=days + 1)
+
+    def keep(expiries):
+        cutoff = dt.date.today() + span
+        out = []
+        for exp in expiries:
+            try:
+                if _iso_to_date(exp) > cutoff:
+                    continue
+            except ValueError:
+                pass
+            out.append(exp)
+        return out
+
+    return keep
 
 
 class SpikeScanner:
@@ -44,102 +505,102 @@ class SpikeScanner:
     def __init__(self, cfg: SpikeConfig, alert_fn: Callable[[Dict], None]):
         self.cfg = cfg
         self.alert_fn = alert_fn
+        # keyed by Yahoo contractSymbol (plain str: one cached hash per lookup)
         self._last_prem = {}      # contract → last observed premium
         self._last_alert = {}     # contract → timestamp of last alert
+        self._scanned = {}        # (ticker, expiry) → cache stamp of the chain last scanned
+        self._pool = _fetch_pool()
+        self._exp_filter = _compile_exp_filter(cfg.exp_filter_days)
+        kind = (cfg.kind or "both").upper()
+        self._sides = ("C", "P") if kind == "BOTH" else (kind[:1],)
 
-    def _key(self, t, e, k, s):
-        return (t.upper(), e, k, float(s))
-
-    def _spread_pct(self, row):
-        bid = float(row.get("bid") or 0)
-        ask = float(row.get("ask") or 0)
-        if bid <= 0 or ask <= 0 or ask <= bid:
-            return 999.0
-        mid = (bid + ask) / 2
-        return (ask - bid) / mid * 100
-
-    def _choose_premium(self, row):
-        last = float(row.get("lastPrice") or 0)
-        if last > 0:
-            return last
-        bid = float(row.get("bid") or 0)
-        ask = float(row.get("ask") or 0)
-        if bid > 0 and ask > 0:
-            return (bid + ask) / 2
-        return max(bid, ask, 0)
+    def _fetch_chain(self, ticker: str, expiry: str):
+        """(stamp, (calls, puts)) for one chain; (None, (None, None)) on failure."""
+        try:
+            return fetch_option_chain_entry(ticker, expiry)
+        except Exception:
+            return None, (None, None)
 
     def run_once(self):
         now = time.time()
+
+        # Build the (ticker, expiry) work list first, then fetch the chains
+        # concurrently -- each option_chain() call is a blocking HTTPS round-trip.
+        jobs = []
+        expiries_by_tk = fetch_expiries(self.cfg.tickers, self._pool)
         for tk in self.cfg.tickers:
-            ticker = yf.Ticker(tk)
-            try:
-                expiries = ticker.options
-            except Exception:
+            jobs.extend((tk, exp) for exp in self._exp_filter(expiries_by_tk.get(tk, ())))
+
+        # A chain served again from cache is identical to the last scan: every
+        # premium equals its prev, so nothing can fire unless both thresholds are <= 0.
+        skip_unchanged = self.cfg.min_abs > 0 or self.cfg.min_pct > 0
+
+        futures = {self._pool.submit(self._fetch_chain, tk, exp): (tk, exp) for tk, exp in jobs}
+        for fut in cf.as_completed(futures):
+            tk, exp = futures[fut]
+            stamp, (calls, puts) = fut.result()
+            if calls is None:
                 continue
+            if skip_unchanged and self._scanned.get((tk, exp)) == stamp:
+                continue
+            self._scanned[(tk, exp)] = stamp
+            self._scan_chain(tk, exp, calls, puts, now)
+
+    def _scan_chain(self, tk: str, exp: str, calls, puts, now: float):
+        """Run spike detection over one fetched (ticker, expiry) chain."""
+        for kind_label in self._sides:
+            side = calls if kind_label == "C" else puts
+            if side is None or len(side["strike"]) == 0:
+                continue
+
+            strikes = side["strike"]
+            last = side["lastPrice"]
+            bid = side["bid"]
+            ask = side["ask"]
 
-            for exp in expiries:
-                if self.cfg.exp_filter_days:
-                    # expiration filter: only exp ≤ X days
-                    try:
-                        exp_dt = dt.datetime.strptime(exp, "%Y-%m-%d")
-                        days = (exp_dt - dt.datetime.now()).days
-                        if days > self.cfg.exp_filter_days:
-                            continue
-                    except:
-                        pass
-
-                try:
-                    chain = ticker.option_chain(exp)
-                except Exception:
+            # _choose_premium_vec / _spread_pct_vec rules; NaN quotes were zeroed at ingest
+            prem, spread = _quote_kernel(last, bid, ask)
+
+            idx = np.flatnonzero((prem >= self.cfg.min_premium) & (spread <= self.cfg.max_spread_pct))
+            if idx.size == 0:
+                continue
+
+            if "contractSymbol" in side:
+                keys = side["contractSymbol"][idx].tolist()
+            else:
+                keys = [occ_symbol(tk, exp, kind_label, s) for s in strikes[idx].tolist()]
+            new = prem[idx]
+            prev = np.fromiter((self._last_prem.get(k, np.nan) for k in keys), dtype=np.float64, count=len(keys))
+            self._last_prem.update(zip(keys, new.tolist()))
+
+            pct, fire = _spike_kernel(new, prev, float(self.cfg.min_pct), float(self.cfg.min_abs))
+
+            for j in np.flatnonzero(fire).tolist():
+                key = keys[j]
+                last_ts = self._last_alert.get(key, 0)
+                if now - last_ts < self.cfg.cooldown_secs:
                     continue
 
-                for kind_label, df in (("C", chain.calls), ("P", chain.puts)):
-                    for _, row in df.iterrows():
-                        strike = float(row["strike"])
-                        prem = self._choose_premium(row)
-                        if prem < self.cfg.min_premium:
-                            continue
-
-                        spr = self._spread_pct(row)
-                        if spr > self.cfg.max_spread_pct:
-                            continue
-
-                        key = self._key(tk, exp, kind_label, strike)
-                        prev = self._last_prem.get(key, None)
-                        self._last_prem[key] = prem
-
-                        if prev is None:
-                            continue
-
-                        if prem <= 0 or prev <= 0:
-                            continue
-
-                        pct = (prem - prev) / prev * 100
-                        if pct >= self.cfg.min_pct and (prem - prev) >= self.cfg.min_abs:
-                            last_ts = self._last_alert.get(key, 0)
-                            if now - last_ts < self.cfg.cooldown_secs:
-                                continue
-
-                            self._last_alert[key] = now
-
-                            event = {
-                                "type": "SPIKE",
-                                "ticker": tk.upper(),
-                                "expiry": exp,
-                                "kind": kind_label,
-                                "strike": strike,
-                                "prev": prev,
-                                "prem": prem,
-                                "pct": pct,
-                                "spread": spr,
-                                "ts": dt.datetime.now().isoformat(),
-                            }
-                            self.alert_fn(event)
+                self._last_alert[key] = now
+
+                event = {
+                    "type": "SPIKE",
+                    "ticker": tk.upper(),
+                    "expiry": exp,
+                    "kind": kind_label,
+                    "strike": float(strikes[idx[j]]),
+                    "prev": float(prev[j]),
+                    "prem": float(new[j]),
+                    "pct": float(pct[j]),
+                    "spread": float(spread[idx[j]]),
+                    "ts": dt.datetime.now().isoformat(),
+                }
+                self.alert_fn(event)
 # ===============================================================
 #          UNIFIED BUYBACK ENGINE (Step B Implementation)
 # ===============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     """Represents a short option position to monitor."""
     ticker: str
@@ -150,8 +611,18 @@ class Contract:
     qty: int = 1
     note: str = ""
 
+    # Derived once in __post_init__; a contract's identity never changes.
+    _key: Tuple[str, str, str, float] = field(init=False, repr=False, compare=False)
+    _contract_symbol: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.ticker = self.ticker.upper()
+        self.kind = self.kind.upper()
+        self._key = (self.ticker, self.expiry, self.kind, float(self.strike))
+        self._contract_symbol = occ_symbol(self.ticker, self.expiry, self.kind, self.strike)
 
-@dataclass
+
+@dataclass(slots=True)
 class BuybackConfig:
     """Config for Unified Buyback Engine."""
     contracts: List[Contract]
@@ -162,6 +633,7 @@ class BuybackConfig:
     interval_secs: int = 15
     max_spread_pct: float = 20.0
     scan_entire_chain: bool = False   # optional wide-scan mode
+    workers: int = 8                  # max chain fetches in flight per cycle
 
 
 class BuybackEngine:
@@ -171,68 +643,86 @@ class BuybackEngine:
         self.cfg = cfg
         self.alert_fn = alert_fn
 
-        # Contract-level state
-        self._prev_prem: Dict[Tuple, float] = {}   # last observed premium
-        self._last_alert: Dict[Tuple, float] = {}  # last alert for cooldown
+        # Contract-level state, stored column-wise: each Yahoo contractSymbol
+        # (e.g. "AAPL240119C00200000") gets a dense integer id into the arrays.
+        self._contract_id: Dict[str, int] = {}
+        self._prev_prem = np.full(1024, np.nan)    # last observed premium (NaN = unseen)
+        self._last_alert = np.zeros(1024)          # last alert for cooldown
         self.cooldown_secs = 60                    # per-contract cooldown
+        self._pool = _fetch_pool()
+
+        # Chain fetch coalescing: (ticker, expiry) -> in-flight future
+        self._inflight: Dict[Tuple[str, str], cf.Future] = {}
+        self._inflight_lock = threading.Lock()
+        # (ticker, expiry) -> (chain stamp, call strike index, put strike index);
+        # kept here rather than on the shared cached chain, rebuilt when the stamp moves
+        self._strike_maps: Dict[Tuple[str, str], Tuple[float, Dict[float, int], Dict[float, int]]] = {}
 
     # ----------------------------------------------------------
     #                    UTILITIES
     # ----------------------------------------------------------
 
-    def _key(self, ticker: str, expiry: str, kind: str, strike: float):
-        return (ticker.upper(), expiry, kind.upper(), float(strike))
-
-    def _spread_pct(self, row: dict) -> float:
-        try:
-            bid = float(row.get("bid") or 0)
-            ask = float(row.get("ask") or 0)
-        except:
-            return 999.0
-        if bid <= 0 or ask <= 0 or ask <= bid:
-            return 999.0
-        mid = (bid + ask) / 2
-        return (ask - bid) / mid * 100
-
-    def _choose_premium(self, row: dict) -> float:
-        try:
-            last = float(row.get("lastPrice") or 0)
-        except:
-            last = 0
-
-        if last > 0:
-            return last
-
-        try:
-            bid = float(row.get("bid") or 0)
-            ask = float(row.get("ask") or 0)
-        except:
-            return 0
-
-        if bid > 0 and ask > 0:
-            return (bid + ask) / 2
-
-        return max(bid, ask)
+    def _ids(self, keys: List[str]) -> np.ndarray:
+        """State-array ids for contract symbols, assigning ids to new ones."""
+        ids = self._contract_id
+        out = np.fromiter((ids.setdefault(k, len(ids)) for k in keys), dtype=np.intp, count=len(keys))
+        if len(ids) > len(self._prev_prem):
+            size = len(self._prev_prem)
+            while size < len(ids):
+                size *= 2
+            grow = size - len(self._prev_prem)
+            self._prev_prem = np.concatenate((self._prev_prem, np.full(grow, np.nan)))
+            self._last_alert = np.concatenate((self._last_alert, np.zeros(grow)))
+        return out
 
     def _fetch_chain(self, ticker: str, expiry: str):
-        tk = yf.Ticker(ticker)
-        try:
-            chain = tk.option_chain(expiry)
-            return chain.calls, chain.puts
-        except:
-            return None, None
-
-    def _fetch_row(self, c: Contract) -> Optional[dict]:
-        calls_df, puts_df = self._fetch_chain(c.ticker, c.expiry)
-        if calls_df is None:
-            return None
-
-        df = calls_df if c.kind.upper() == "C" else puts_df
-        sub = df[df["strike"] == c.strike]
-        if sub.empty:
-            return None
+        """
+        Fetch (stamp, (calls, puts)) for one chain (see fetch_option_chain_entry);
+        (None, (None, None)) on failure.
 
-        return dict(sub.iloc[0])
+        Concurrent callers asking for the same (ticker, expiry) share one
+        upstream request. Completed results are reused through
+        fetch_option_chain's cache, so there is no second memo here.
+        """
+        key = (ticker.upper(), expiry)
+        with self._inflight_lock:
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = cf.Future()
+                self._inflight[key] = fut
+        if not owner:
+            return fut.result()
+
+        result = (None, (None, None))
+        try:
+            result = fetch_option_chain_entry(ticker, expiry)
+        except Exception:
+            pass
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            fut.set_result(result)
+        return result
+
+    def _fetch_chains(self, jobs):
+        """
+        Yield ((ticker, expiry), (stamp, (calls, puts))) as fetches finish, keeping at
+        most cfg.workers requests in flight. Results are consumed on the
+        calling thread, so engine state is never written concurrently.
+        """
+        it = iter(jobs)
+        pending = {}
+        for job in itertools.islice(it, max(1, self.cfg.workers)):
+            pending[self._pool.submit(self._fetch_chain, *job)] = job
+        while pending:
+            done, _ = cf.wait(pending, return_when=cf.FIRST_COMPLETED)
+            for fut in done:
+                job = pending.pop(fut)
+                nxt = next(it, None)
+                if nxt is not None:
+                    pending[self._pool.submit(self._fetch_chain, *nxt)] = nxt
+                yield job, fut.result()
 
     # ----------------------------------------------------------
     #                    CORE ENGINE LOGIC
@@ -242,29 +732,50 @@ class BuybackEngine:
         """Run one cycle across user contracts."""
         now = time.time()
 
-        # 1) Focused mode: user's contract list
+        # 1) Focused mode: user's contract list, one chain fetch per (ticker, expiry)
+        groups: Dict[Tuple[str, str], List[Contract]] = defaultdict(list)
         for c in self.cfg.contracts:
-            self._check_contract(c, now)
+            groups[c._key[:2]].append(c)
+
+        for key, (stamp, (calls, puts)) in self._fetch_chains(groups):
+            if calls is None:
+                continue
+            cs = groups[key]
+            maps = self._strike_maps.get(key)
+            if maps is None or maps[0] != stamp:
+                maps = (stamp, _strike_index(calls["strike"]), _strike_index(puts["strike"]))
+                self._strike_maps[key] = maps
+
+            for is_call, side, pos in ((True, calls, maps[1]), (False, puts, maps[2])):
+                wanted = [c for c in cs if (c.kind == "C") == is_call]
+                if not wanted:
+                    continue
+                last, bid, ask = side["lastPrice"], side["bid"], side["ask"]
+                syms = side.get("contractSymbol")
+                for c in wanted:
+                    i = pos.get(c.strike, -1)
+                    if i < 0:
+                        continue
+                    sym = syms[i] if syms is not None else None
+                    self._check_contract(c, float(last[i]), float(bid[i]), float(ask[i]), sym, now)
 
         # 2) Wide mode: scan *all* contracts (optional)
         if self.cfg.scan_entire_chain:
             self._scan_chain_for_collapse(now)
 
-    def _check_contract(self, c: Contract, now: float):
-        """Check one contract for collapse events."""
-        key = self._key(c.ticker, c.expiry, c.kind, c.strike)
-        row = self._fetch_row(c)
-        if row is None:
-            return
-
-        prem = self._choose_premium(row)
-        spr = self._spread_pct(row)
+    def _check_contract(self, c: Contract, last: float, bid: float, ask: float,
+                        symbol: Optional[str], now: float):
+        """Check one contract's quote (read straight from the chain arrays) for collapse events."""
+        key = symbol or c._contract_symbol
+        prem = _choose_premium_scalar(last, bid, ask)
+        spr = _spread_pct_scalar(bid, ask)
 
         if prem <= 0 or spr > self.cfg.max_spread_pct:
             return
 
-        prev = self._prev_prem.get(key, float("nan"))
-        self._prev_prem[key] = prem
+        i = self._ids([key])[0]
+        prev = float(self._prev_prem[i])
+        self._prev_prem[i] = prem
 
         # Capture %
         capture = 0.0
@@ -277,8 +788,7 @@ class BuybackEngine:
             drop = (prev - prem) / prev * 100
 
         # Per-contract cooldown
-        last_ts = self._last_alert.get(key, 0)
-        if now - last_ts < self.cooldown_secs:
+        if now - self._last_alert[i] < self.cooldown_secs:
             return
 
         # -------------------------------
@@ -304,14 +814,14 @@ class BuybackEngine:
             return
 
         # Mark cooldown
-        self._last_alert[key] = now
+        self._last_alert[i] = now
 
         # Build alert event
         event = {
             "type": "BUYBACK",
-            "ticker": c.ticker.upper(),
+            "ticker": c.ticker,
             "expiry": c.expiry,
-            "kind": c.kind.upper(),
+            "kind": c.kind,
             "strike": c.strike,
             "premium": prem,
             "capture_pct": capture,
@@ -339,74 +849,97 @@ class BuybackEngine:
             - floor price hit
             - fast drop since last observed
         """
-        tickers = sorted({c.ticker.upper() for c in self.cfg.contracts})
+        tickers = sorted({c.ticker for c in self.cfg.contracts})
 
+        jobs = []
+        expiries_by_tk = fetch_expiries(tickers, self._pool)
         for tk in tickers:
-            ticker = yf.Ticker(tk)
+            jobs.extend((tk, exp) for exp in expiries_by_tk.get(tk, ()))
 
-            try:
-                expiries = ticker.options
-            except Exception:
+        for (tk, exp), (_, (calls, puts)) in self._fetch_chains(jobs):
+            if calls is None:
                 continue
+            self._collapse_chain(tk, exp, calls, puts, now)
 
-            for exp in expiries:
-                calls_df, puts_df = self._fetch_chain(tk, exp)
-                if calls_df is None:
-                    continue
-
-                for kind_label, df in (("C", calls_df), ("P", puts_df)):
-                    for _, row in df.iterrows():
-                        strike = float(row["strike"])
-                        key = self._key(tk, exp, kind_label, strike)
+    def _collapse_chain(self, tk: str, exp: str, calls, puts, now: float):
+        """Run wide-mode collapse detection over one fetched chain."""
+        for kind_label, side in (("C", calls), ("P", puts)):
+            if side is None or len(side["strike"]) == 0:
+                continue
 
-                        prem = self._choose_premium(row)
-                        spr = self._spread_pct(row)
+            strikes = side["strike"]
+            last = side["lastPrice"]
+            bid = side["bid"]
+            ask = side["ask"]
 
-                        if prem <= 0 or spr > self.cfg.max_spread_pct:
-                            continue
+            # _choose_premium_vec / _spread_pct_vec rules; NaN quotes were zeroed at ingest
+            prem, spread = _quote_kernel(last, bid, ask)
 
-                        prev = self._prev_prem.get(key, float("nan"))
-                        self._prev_prem[key] = prem
+            idx = np.flatnonzero((prem > 0) & (spread <= self.cfg.max_spread_pct))
+            if idx.size == 0:
+                continue
 
-                        drop = 0.0
-                        if math.isfinite(prev) and prev > 0 and prem < prev:
-                            drop = (prev - prem) / prev * 100
+            if "contractSymbol" in side:
+                keys = side["contractSymbol"][idx].tolist()
+            else:
+                keys = [occ_symbol(tk, exp, kind_label, s) for s in strikes[idx].tolist()]
+            new = prem[idx]
+            ids = self._ids(keys)
+            prev = self._prev_prem[ids]
+            self._prev_prem[ids] = new
 
-                        last_ts = self._last_alert.get(key, 0)
-                        if now - last_ts < self.cooldown_secs:
-                            continue
+            drop, hits = _drop_kernel(new, prev, float(self.cfg.floor), float(self.cfg.drop_pct_since_last))
 
-                        reasons = []
-                        if prem <= self.cfg.floor:
-                            reasons.append("FLOOR_CHAIN")
-                        if drop >= self.cfg.drop_pct_since_last:
-                            reasons.append(f"FAST_DROP_CHAIN_{int(drop)}")
+            for j in np.flatnonzero(hits).tolist():
+                i = ids[j]
+                if now - self._last_alert[i] < self.cooldown_secs:
+                    continue
 
-                        if not reasons:
-                            continue
+                p = float(new[j])
+                d = float(drop[j])
+                reasons = []
+                if p <= self.cfg.floor:
+                    reasons.append("FLOOR_CHAIN")
+                if d >= self.cfg.drop_pct_since_last:
+                    reasons.append(f"FAST_DROP_CHAIN_{int(d)}")
 
-                        self._last_alert[key] = now
+                self._last_alert[i] = now
 
-                        event = {
-                            "type": "BUYBACK_CHAIN",
-                            "ticker": tk,
-                            "expiry": exp,
-                            "kind": kind_label,
-                            "strike": strike,
-                            "premium": prem,
-                            "drop_pct": drop,
-                            "spread_pct": spr,
-                            "reasons": reasons,
-                            "ts": dt.datetime.now().isoformat(),
-                        }
+                event = {
+                    "type": "BUYBACK_CHAIN",
+                    "ticker": tk,
+                    "expiry": exp,
+                    "kind": kind_label,
+                    "strike": float(strikes[idx[j]]),
+                    "premium": p,
+                    "drop_pct": d,
+                    "spread_pct": float(spread[idx[j]]),
+                    "reasons": reasons,
+                    "ts": dt.datetime.now().isoformat(),
+                }
 
-                        self.alert_fn(event)
+                self.alert_fn(event)
 
 
 # ===============================================================
 #                       WRAPPER CLASSES
 # ===============================================================
 
+def _run_on_cadence(tick: Callable[[], None], interval_secs: float, stop: threading.Event) -> None:
+    """
+    Call tick() every interval_secs until stop is set.
+    Deadlines are fixed on the monotonic clock, so time spent inside tick()
+    counts toward the interval; an overrunning tick starts the next one
+    immediately instead of queueing a burst of catch-up ticks.
+    """
+    next_t = time.monotonic()
+    while not stop.is_set():
+        tick()
+        next_t = max(next_t + interval_secs, time.monotonic())
+        if stop.wait(next_t - time.monotonic()):
+            break
+
+
 class StoppableSpike:
     """
     Thread-friendly wrapper for SpikeScanner.
@@ -415,15 +948,13 @@ class StoppableSpike:
 
     def __init__(self, cfg: SpikeConfig, alert_fn: Callable[[Dict], None]):
         self.scanner = SpikeScanner(cfg, alert_fn)
-        self._stop_flag = False
+        self._stop = threading.Event()
 
     def stop(self):
-        self._stop_flag = True
+        self._stop.set()
 
     def run(self):
-        while not self._stop_flag:
-            self.scanner.run_once()
-            time.sleep(1)
+        _run_on_cadence(self.scanner.run_once, 1, self._stop)
 
 
 class StoppableBuyback:
@@ -434,15 +965,13 @@ class StoppableBuyback:
 
     def __init__(self, cfg: BuybackConfig, alert_fn: Callable[[Dict], None]):
         self.engine = BuybackEngine(cfg, alert_fn)
-        self._stop_flag = False
+        self._stop = threading.Event()
 
     def stop(self):
-        self._stop_flag = True
+        self._stop.set()
 
     def run(self):
-        while not self._stop_flag:
-            self.engine.run_once()
-            time.sleep(self.engine.cfg.interval_secs)
+        _run_on_cadence(self.engine.run_once, self.engine.cfg.interval_secs, self._stop)
 
 # ===============================================================
 #                POSITIONS / CSV HELPER FUNCTIONS
@@ -457,37 +986,69 @@ import csv
 from pathlib import Path
 
 
+# Header spellings accepted for each position column, after lower-casing and
+# dropping spaces/underscores (so "OpenCredit", "open credit", "Open_Credit" all match).
+_POSITION_ALIASES = {
+    "ticker": "ticker", "symbol": "ticker",
+    "kind": "kind", "type": "kind",
+    "strike": "strike",
+    "expiry": "expiry", "expiration": "expiry",
+    "opencredit": "open_credit", "credit": "open_credit",
+    "qty": "qty", "quantity": "qty",
+    "note": "note", "notes": "note",
+}
+
+
+def _position_column(name: str) -> str:
+    key = name.strip().lower().replace("_", "").replace(" ", "")
+    return _POSITION_ALIASES.get(key, name)
+
+
 def load_positions_csv(path: str) -> List[Contract]:
     """
     Load short option positions from a CSV file.
 
     Expected CSV columns:
         ticker, kind, strike, expiry, open_credit, qty, note
+    Headers are matched case-insensitively and common spellings are
+    accepted (Ticker, Type, Strike, Expiry, OpenCredit, Qty, Note, ...).
 
     Extra columns will be ignored.
     Missing optional columns default automatically.
+    Rows whose strike, open_credit or qty is not a number are skipped.
     """
     pos = []
     p = Path(path)
     if not p.exists():
         return pos
 
-    with p.open("r", newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            try:
-                c = Contract(
-                    ticker=row.get("ticker", "").strip().upper(),
-                    kind=row.get("kind", "").strip().upper(),
-                    strike=float(row.get("strike", 0)),
-                    expiry=row.get("expiry", "").strip(),
-                    open_credit=float(row.get("open_credit", 0)),
-                    qty=int(row.get("qty", 1)),
-                    note=row.get("note", ""),
-                )
-                pos.append(c)
-            except Exception:
-                continue
+    defaults = {"ticker": "", "kind": "", "strike": "0", "expiry": "",
+                "open_credit": "0", "qty": "1", "note": ""}
+    try:
+        df = pd.read_csv(p, dtype=str, keep_default_na=False)
+    except Exception:
+        return pos
+    df.columns = [_position_column(c) for c in df.columns]
+    df = df.loc[:, ~df.columns.duplicated()]    # first matching header wins
+    df = df.reindex(columns=list(defaults)).fillna(defaults)
+
+    # Parse numeric columns in one pass each; bad cells become NaN and drop the row.
+    strike = pd.to_numeric(df["strike"], errors="coerce")
+    credit = pd.to_numeric(df["open_credit"], errors="coerce")
+    qty = pd.to_numeric(df["qty"], errors="coerce")
+    ok = (strike.notna() & credit.notna() & qty.notna() & (qty % 1 == 0)).to_numpy()
+
+    rows = zip(
+        df["ticker"].str.strip()[ok].tolist(),
+        df["kind"].str.strip()[ok].tolist(),
+        strike[ok].astype(float).tolist(),
+        df["expiry"].str.strip()[ok].tolist(),
+        credit[ok].astype(float).tolist(),
+        qty[ok].astype(int).tolist(),
+        df["note"][ok].tolist(),
+    )
+    for row in rows:
+        pos.append(Contract(*row))
 
     return pos
 
@@ -525,49 +1086,47 @@ def safe_int(x, default=0):
         return default
 
 
+def _fmt_spike(e: Dict) -> str:
+    return (
+        f"[SPIKE] {e['ticker']} {e['expiry']} {e['kind']}{e['strike']} "
+        f"prem={e['prem']:.2f} pct={e['pct']:.1f}% spread={e['spread']:.1f}% "
+        f"@ {e['ts']}"
+    )
+
+
+def _fmt_buyback(e: Dict) -> str:
+    return (
+        f"[BUYBACK] {e['ticker']} {e['expiry']} {e['kind']}{e['strike']} "
+        f"prem={e['premium']:.2f} capture={e['capture_pct']:.1f}% "
+        f"drop={e['drop_pct']:.1f}% spread={e['spread_pct']:.1f}% "
+        f"reasons={','.join(e.get('reasons', ()))} @ {e['ts']}"
+    )
+
+
+def _fmt_chain(e: Dict) -> str:
+    return (
+        f"[BUYBACK_CHAIN] {e['ticker']} {e['expiry']} {e['kind']}{e['strike']} "
+        f"prem={e['premium']:.2f} drop={e['drop_pct']:.1f}% spread={e['spread_pct']:.1f}% "
+        f"reasons={','.join(e.get('reasons', ()))} @ {e['ts']}"
+    )
+
+
+FORMATTERS: Dict[str, Callable[[Dict], str]] = {
+    "SPIKE": _fmt_spike,
+    "BUYBACK": _fmt_buyback,
+    "BUYBACK_CHAIN": _fmt_chain,
+}
+
+
 def format_event_msg(event: Dict) -> str:
     """
     Create a human-readable log line for SPIKE or BUYBACK events.
     The GUI can use this or override with its own formatting.
     """
-    t = event.get("type")
-
-    if t == "SPIKE":
-        return (
-            f"[SPIKE] {event.get('ticker')} {event.get('expiry')} "
-            f"{event.get('kind')}{event.get('strike')} "
-            f"prem={event.get('prem'):.2f} "
-            f"pct={event.get('pct'):.1f}% "
-            f"spread={event.get('spread'):.1f}% "
-            f"@ {event.get('ts')}"
-        )
-
-    if t == "BUYBACK":
-        reasons = ",".join(event.get("reasons", []))
-        return (
-            f"[BUYBACK] {event.get('ticker')} {event.get('expiry')} "
-            f"{event.get('kind')}{event.get('strike')} "
-            f"prem={event.get('premium'):.2f} "
-            f"capture={event.get('capture_pct'):.1f}% "
-            f"drop={event.get('drop_pct'):.1f}% "
-            f"spread={event.get('spread_pct'):.1f}% "
-            f"reasons={reasons} "
-            f"@ {event.get('ts')}"
-        )
-
-    if t == "BUYBACK_CHAIN":
-        reasons = ",".join(event.get("reasons", []))
-        return (
-            f"[BUYBACK_CHAIN] {event.get('ticker')} {event.get('expiry')} "
-            f"{event.get('kind')}{event.get('strike')} "
-            f"prem={event.get('premium'):.2f} "
-            f"drop={event.get('drop_pct'):.1f}% "
-            f"spread={event.get('spread_pct'):.1f}% "
-            f"reasons={reasons} "
-            f"@ {event.get('ts')}"
-        )
-
-    return f"[EVENT] {event}"
+    fmt = FORMATTERS.get(event.get("type"))
+    if fmt is None:
+        return f"[EVENT] {event}"
+    return fmt(event)
 
 # ===============================================================
 #                 SIMPLE COMMAND-LINE INTERFACE
@@ -606,7 +1165,7 @@ def run_spike_cli():
         print("[SPIKE] Stopped.")
 
 
-def run_buyback_cli():
+def run_buyback_cli(workers: int = 8):
     """
     Example CLI runner for BuybackEngine.
     Modify below for your own test contracts.
@@ -623,6 +1182,7 @@ def run_buyback_cli():
         interval_secs=15,
         max_spread_pct=20,
         scan_entire_chain=False,
+        workers=workers,
     )
     runner = StoppableBuyback(cfg, _cli_alert_printer)
     print("[BUYBACK] Starting CLI buyback monitor. Press Ctrl+C to stop.")
@@ -651,7 +1211,7 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("   python OptionSuite_FreshStart.py --spike")
-        print("   python OptionSuite_FreshStart.py --buyback")
+        print("   python OptionSuite_FreshStart.py --buyback [--workers N]")
         print("")
         sys.exit(0)
 
@@ -662,7 +1222,14 @@ def main():
         return
 
     if mode == "--buyback":
-        run_buyback_cli()
+        workers = 8
+        if "--workers" in sys.argv:
+            try:
+                workers = int(sys.argv[sys.argv.index("--workers") + 1])
+            except (IndexError, ValueError):
+                print("--workers needs an integer")
+                sys.exit(2)
+        run_buyback_cli(workers)
         return
 
     print(f"Unknown mode: {mode}")
@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 import os
+import math
 import threading
 import time
 import datetime as dt
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from itertools import repeat
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple
 
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -28,47 +33,145 @@ try:
 except Exception:
     yf = None
 
+# Floor on the pause between scanner/buyback passes
+MIN_WAIT_SECS = 1.0
+
+# Builder combobox changes within this window collapse into one recalc
+RECALC_DEBOUNCE_MS = 80
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PRESETS_DIR = os.path.join(_BASE_DIR, "presets")
+
+# Buyback chain table columns, in display order
+CHAIN_COLS = ("strike", "call_bid", "call_ask", "put_bid", "put_ask", "exp")
+
+# Prepared two-decimal formatter for per-row cells ("%.2f" % x without the parse)
+_FMT_2F = "%.2f".__mod__
+
+# Comma/whitespace separators for symbol lists, split with str.split()
+_TICKER_TRANS = str.maketrans(",\t\r\n", "    ")
+
 
 # =====================================================
 #  LOGGING ADAPTERS
 # =====================================================
+# (epoch second, "HH:MM:SS"): log lines within the same second reuse the string
+_HMS: Tuple[int, str] = (0, "")
+
+
+def _hms() -> str:
+    global _HMS
+    now = int(time.time())
+    sec, s = _HMS
+    if now != sec:
+        s = time.strftime("%H:%M:%S", time.localtime(now))
+        _HMS = (now, s)
+    return s
+
+
 class LogRouter:
-    """Generic text logger to the Logs tab."""
+    """
+    Generic text logger to the Logs tab.
+
+    Keeps the last MAX_LINES lines in a ring buffer; the Text widget is only
+    rewritten from it once REWRITE_EVERY old lines have fallen off, instead
+    of trimming the widget on every write. Writes made while handling one
+    event are flushed together from after_idle().
+    """
+
+    MAX_LINES = 2000
+    REWRITE_EVERY = 256
 
     def __init__(self, log_widget: tk.Text):
         self.log_widget = log_widget
+        self._lines: deque = deque(maxlen=self.MAX_LINES)
+        self._dropped = 0
+        self._unwritten: List[str] = []
+        self._flush_pending = False
 
     def log(self, msg: str) -> None:
-        ts = time.strftime("%H:%M:%S")
-        line = f"[{ts}] {msg}"
-        self.log_widget.configure(state="normal")
-        self.log_widget.insert("end", line + "\n")
-        self.log_widget.see("end")
-        self.log_widget.configure(state="disabled")
+        ts = _hms()
+        self.append([f"[{ts}] {msg}"])
+
+    def log_many(self, msgs: List[str]) -> None:
+        """Append several lines with a single insert and one scroll."""
+        if not msgs:
+            return
+        ts = _hms()
+        self.append([f"[{ts}] {m}" for m in msgs])
+
+    def append(self, lines: List[str]) -> None:
+        """Write already-formatted lines to the log."""
+        if not lines:
+            return
+        buf = self._lines
+        over = len(buf) + len(lines) - self.MAX_LINES
+        buf.extend(lines)
+        if over > 0:
+            self._dropped += over
+        self._unwritten.extend(lines)
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.log_widget.after_idle(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_pending = False
+        lines, self._unwritten = self._unwritten, []
+        if not lines:
+            return
+        w = self.log_widget
+        w.configure(state="normal")
+        if self._dropped >= self.REWRITE_EVERY:
+            self._dropped = 0
+            w.delete("1.0", "end")
+            w.insert("end", "\n".join(self._lines) + "\n")
+        else:
+            w.insert("end", "\n".join(lines) + "\n")
+        w.see("end")
+        w.configure(state="disabled")
 
 
 class BuybackGuiLog:
     """Adapter so BuybackMonitor.alert_log writes into GUI log + recent alerts."""
 
-    def __init__(self, log_widget: tk.Text, recent_widget: tk.Listbox, max_recent: int = 40):
-        self.log_widget = log_widget
+    def __init__(self, router: LogRouter, recent_widget: Optional[tk.Listbox], max_recent: int = 40):
+        self.router = router
         self.recent_widget = recent_widget
         self.max_recent = max_recent
+        # Lines from the buyback thread, flushed on the Tk thread by _drain()
+        self._pending: deque = deque()
+        self._scheduled = False
 
     def _write_line(self, line: str) -> None:
+        self._pending.append(line)
+        if not self._scheduled:
+            self._scheduled = True
+            try:
+                self.router.log_widget.after(10, self._drain)
+            except Exception:
+                # GUI is closing
+                pass
+
+    def _drain(self) -> None:
+        self._scheduled = False
+        pending = self._pending
+        lines = [pending.popleft() for _ in range(len(pending))]
+        if not lines:
+            return
         # full log
-        self.log_widget.configure(state="normal")
-        self.log_widget.insert("end", line + "\n")
-        self.log_widget.see("end")
-        self.log_widget.configure(state="disabled")
-        # recent alerts
-        self.recent_widget.insert("end", line)
-        if self.recent_widget.size() > self.max_recent:
-            self.recent_widget.delete(0)
-        self.recent_widget.see("end")
+        self.router.append(lines)
+        # recent alerts (None until the Buyback tab is built)
+        recent = self.recent_widget
+        if recent is None:
+            return
+        recent.insert("end", *lines[-self.max_recent:])
+        extra = recent.size() - self.max_recent
+        if extra > 0:
+            recent.delete(0, extra - 1)
+        recent.see("end")
 
     def info(self, msg: str) -> None:
-        ts = time.strftime("%H:%M:%S")
+        ts = _hms()
         self._write_line(f"[BUYBACK][{ts}] {msg}")
 
     def write(self, row: List[Any]) -> None:
@@ -85,6 +188,31 @@ class BuybackGuiLog:
         self._write_line(f"[BUYBACK] {line}")
 
 
+# =====================================================
+#  WIDGET HELPERS
+# =====================================================
+def _detach_packed(widget: tk.Widget):
+    """pack_forget() a widget; return a callable that restores its slot and scroll."""
+    try:
+        info = widget.pack_info()
+        slaves = widget.master.pack_slaves()
+        top = widget.yview()[0]
+    except Exception:
+        return None
+    i = slaves.index(widget)
+    if i + 1 < len(slaves):
+        # keep packing order (e.g. table before its scrollbar)
+        info.pop("in", None)
+        info["before"] = slaves[i + 1]
+    widget.pack_forget()
+
+    def repack() -> None:
+        widget.pack(**info)
+        widget.yview_moveto(top)
+
+    return repack
+
+
 # =====================================================
 #  SPIKE LOGGER ADAPTER
 # =====================================================
@@ -95,13 +223,54 @@ class GuiSpikeLogger:
     It must implement a .write(row) method compatible with core.AlertLog usage.
     """
 
+    DRAIN_MS = 50
+    DRAIN_MAX = 500
+    MAX_PENDING = 5000  # oldest queued alerts are dropped beyond this
+    MAX_ROWS = 800
+    DETACH_MIN = 20  # unpack the table while inserting bursts larger than this
+
     def __init__(self, gui: "OptionSuiteGUI"):
         self.gui = gui
-
-    def _insert_row(self, vals: Tuple[Any, ...], log_line: str) -> None:
-        # Insert into scanner alert table
-        self.gui.alert_table.insert("", "end", values=vals)
-        self.gui.logger.log(log_line)
+        # Filled by the scanner thread, emptied on the Tk thread by _drain().
+        # deque append/popleft are atomic, so no extra lock is needed.
+        self._pending: deque = deque(maxlen=self.MAX_PENDING)
+        # overflow count: bumped by the scanner thread, read-and-reset by _drain()
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        # iids currently in the alert table, oldest first (FIFO eviction)
+        self._iids: deque = deque()
+        self.gui.after(self.DRAIN_MS, self._drain)
+
+    def _drain(self) -> None:
+        pending = self._pending
+        batch = []
+        while pending and len(batch) < self.DRAIN_MAX:
+            batch.append(pending.popleft())
+        if batch:
+            table = self.gui.alert_table
+            iids = self._iids
+            repack = _detach_packed(table) if len(batch) > self.DETACH_MIN else None
+            insert, push = table.insert, iids.append
+            try:
+                for vals, _ in batch:
+                    push(insert("", "end", values=vals))
+                if len(iids) > self.MAX_ROWS:
+                    table.delete(*[iids.popleft() for _ in range(len(iids) - self.MAX_ROWS)])
+            finally:
+                # never leave the table unpacked, even if an insert fails
+                if repack is not None:
+                    repack()
+            lines = [line for _, line in batch]
+            if self._dropped:
+                with self._dropped_lock:
+                    dropped, self._dropped = self._dropped, 0
+                lines.append(f"[Spike] Dropped {dropped} alerts (GUI queue full).")
+            self.gui.logger.log_many(lines)
+        try:
+            self.gui.after(self.DRAIN_MS, self._drain)
+        except Exception:
+            # GUI is closing
+            pass
 
     def write(self, row: List[Any]) -> None:
         """
@@ -114,6 +283,12 @@ class GuiSpikeLogger:
             # If anything weird, just ignore to avoid crashing GUI
             return
 
+        # Format the strike once for both the table and the log line
+        try:
+            strike = _FMT_2F(float(strike))
+        except (TypeError, ValueError):
+            strike = "" if strike is None else str(strike)
+
         # Values for Scanner Treeview:
         # columns = ("ticker", "strike", "exp", "premium", "pct", "volume", "time")
         vals = (
@@ -127,12 +302,11 @@ class GuiSpikeLogger:
         )
         log_line = f"[Spike] {tk_sym} {exp} {oc_type}{strike} Δ{pct_s}"
 
-        # Schedule on main thread (tkinter not thread-safe)
-        try:
-            self.gui.after(0, self._insert_row, vals, log_line)
-        except Exception:
-            # If GUI is closing, ignore
-            pass
+        # Queue for the main thread (tkinter not thread-safe)
+        if len(self._pending) == self.MAX_PENDING:
+            with self._dropped_lock:
+                self._dropped += 1
+        self._pending.append((vals, log_line))
 
 
 # =====================================================
@@ -163,13 +337,13 @@ class StoppableBuyback(core.BuybackMonitor if core else object):
         )
 
         while not self._stop.is_set():
-            t0 = time.time()
+            t0 = time.monotonic()
             try:
                 self._check_all()
             except Exception as e:
                 self.alert_log.info(f"Buyback loop error: {e}")
-            elapsed = time.time() - t0
-            wait = max(0, self.cfg.interval_secs - int(elapsed))
+            # at least MIN_WAIT_SECS between passes, even after a slow or failing one
+            wait = max(MIN_WAIT_SECS, self.cfg.interval_secs - (time.monotonic() - t0))
             if self._stop.wait(wait):
                 break
 
@@ -180,6 +354,9 @@ class StoppableBuyback(core.BuybackMonitor if core else object):
 class StoppableSpike:
     """
     Wraps core.SpikeScanner with a stop event and routes alerts into the GUI.
+
+    The GUI drives it: start() on the Tk thread, then scan_once() per tick on
+    the GUI's scan worker, rescheduled with after() until stop() is called.
     """
 
     def __init__(self, cfg: core.SpikeConfig, gui_logger: GuiSpikeLogger):
@@ -189,50 +366,111 @@ class StoppableSpike:
 
         # Resolve presets_dir from GUI if present
         gui = gui_logger.gui
-        presets_dir = getattr(gui, "presets_dir", os.path.join(os.path.dirname(__file__), "presets"))
+        presets_dir = getattr(gui, "presets_dir", _PRESETS_DIR)
 
         self.engine = core.SpikeScanner(cfg, presets_dir=presets_dir)
         # Override engine's AlertLog with GUI logger
         self.engine.alert_log = gui_logger
 
+        self._tickers: List[str] = []
+
     def stop(self) -> None:
         self._stop.set()
 
-    def run_gui_loop(self) -> None:
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def start(self) -> bool:
+        """Resolve tickers and log the banner (Tk thread). False on error."""
         gui = self.gui_logger.gui
         try:
-            tks = self.engine.resolve_tickers()
+            self._tickers = self.engine.resolve_tickers()
         except Exception as e:
             gui.logger.log(f"[Spike ERROR] resolve_tickers: {e}")
-            return
+            return False
 
         gui.logger.log(
-            f"[Spike] Starting scanner on {len(tks)} tickers | "
+            f"[Spike] Starting scanner on {len(self._tickers)} tickers | "
             f"min_abs=${self.cfg.min_abs} | min_pct={self.cfg.min_pct}% | "
             f"exp_filter={self.cfg.exp_filter}"
         )
+        return True
 
-        while not self._stop.is_set():
-            t0 = time.time()
-            try:
-                # only one pass per loop
-                self.engine._scan_once(tks)
-            except Exception as e:
-                gui.logger.log(f"[Spike ERROR] scan: {e}")
-            elapsed = time.time() - t0
-            wait = max(0, self.cfg.interval_secs - int(elapsed))
-            if self._stop.wait(wait):
-                break
-
-        gui.logger.log("[Spike] Scanner stopped.")
+    def scan_once(self) -> None:
+        """One scan pass; alerts go through gui_logger's queue."""
+        self.engine._scan_once(self._tickers)
 
 
 # =====================================================
 #  OPTIONS CHAIN VIA YFINANCE
 # =====================================================
-def fetch_yf_options_chain(symbol: str, max_exps: int = 8) -> List[Dict[str, Any]]:
+# One yf.Ticker per symbol so repeat fetches reuse its session and metadata.
+# A Ticker memoizes its expiration list and fast_info quote for its lifetime,
+# so lookups that must see new data ask for a fresh one.
+_TICKER_CACHE: Dict[str, Any] = {}
+_TICKER_LOCK = threading.Lock()
+
+
+def _ticker(symbol: str, fresh: bool = False):
+    """Shared yf.Ticker for `symbol`; fresh=True replaces it."""
+    if core is not None:
+        # share core's instances with the engines
+        return core._yf_ticker(symbol, fresh=fresh)
+    with _TICKER_LOCK:
+        t = None if fresh else _TICKER_CACHE.get(symbol)
+        if t is None:
+            t = _TICKER_CACHE[symbol] = yf.Ticker(symbol)
+    return t
+
+
+# listed expiries change at most daily; the GUI re-reads them every EXP_TTL_SECS
+EXP_TTL_SECS = 1800.0
+# symbol -> (monotonic stamp, expirations); only used when core is missing
+_EXP_CACHE: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+_EXP_LOCK = threading.Lock()
+
+
+def _get_expirations(symbol: str, refresh: bool = False) -> Tuple[str, ...]:
+    if core is not None:
+        # core's memoized, lock-guarded listing, shared with the engines
+        return core.fetch_expiries([symbol], refresh=refresh, ttl=EXP_TTL_SECS).get(symbol, ())
+    now = time.monotonic()
+    with _EXP_LOCK:
+        hit = None if refresh else _EXP_CACHE.get(symbol)
+    if hit is not None and now - hit[0] < EXP_TTL_SECS:
+        return hit[1]
+    exps = tuple(_ticker(symbol, fresh=True).options or ())
+    if exps:
+        with _EXP_LOCK:
+            _EXP_CACHE[symbol] = (now, exps)
+    return exps
+
+
+# (symbol, max_exps) -> (monotonic stamp, merged rows); repeat clicks on
+# "Fetch" within _chain_rows_ttl() are served from here without touching the
+# network. Rows are shared between callers and must not be mutated.
+# Written from the I/O pool threads, so guarded by _CHAIN_ROWS_LOCK; expired
+# entries are dropped whenever a new one is stored.
+CHAIN_TTL_SECS = 60.0
+_CHAIN_ROWS_CACHE: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+_CHAIN_ROWS_LOCK = threading.Lock()
+
+
+def _chain_rows_ttl() -> float:
+    """CHAIN_TTL_SECS, capped by core's market-clock TTL (15s during RTH)."""
+    if core is not None:
+        return min(CHAIN_TTL_SECS, core.ttl_for_context())
+    return CHAIN_TTL_SECS
+
+
+def fetch_yf_options_chain(
+    symbol: str, max_exps: int = 8, refresh: bool = False
+) -> List[Dict[str, Any]]:
     """
     Use yfinance to pull options chain for up to max_exps expirations.
+    Results are cached for _chain_rows_ttl(); refresh=True skips the row
+    cache, re-reads the expiration listing on a fresh yf.Ticker and
+    bypasses core's per-expiry chain cache.
 
     Returns list of rows:
       {
@@ -253,95 +491,119 @@ def fetch_yf_options_chain(symbol: str, max_exps: int = 8) -> List[Dict[str, Any
     if not symbol:
         return []
 
-    t = yf.Ticker(symbol)
-    expirations = t.options
+    now = time.monotonic()
+    ttl = _chain_rows_ttl()
+    with _CHAIN_ROWS_LOCK:
+        hit = None if refresh else _CHAIN_ROWS_CACHE.get((symbol, max_exps))
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+
+    expirations = _get_expirations(symbol, refresh=refresh)
     if not expirations:
         return []
+    t = _ticker(symbol)
 
     rows_map: Dict[Tuple[str, float], Dict[str, Any]] = {}
 
-    def process_exp(exp_str: str) -> None:
+    def fetch_exp(exp_str: str):
         try:
+            if core is not None:
+                # core's TTL chain cache (memory + disk), shared with the engines
+                return core.fetch_option_chain(symbol, exp_str, refresh=refresh)
             chain = t.option_chain(exp_str)
+            return chain.calls, chain.puts
         except Exception:
+            return None
+
+    def process_exp(exp_str: str, sides) -> None:
+        if sides is None:
             return
-        calls = getattr(chain, "calls", [])
-        puts = getattr(chain, "puts", [])
-        # calls
-        for _, row in calls.iterrows():
-            strike = float(row.get("strike", 0.0))
-            key = (exp_str, strike)
-            r = rows_map.setdefault(
-                key,
-                {
-                    "strike": strike,
-                    "call_bid": None,
-                    "call_ask": None,
-                    "put_bid": None,
-                    "put_ask": None,
-                    "exp": exp_str,
-                    "call_delta": None,
-                    "put_delta": None,
-                },
-            )
-            bid = row.get("bid")
-            ask = row.get("ask")
-            delta = row.get("delta")
-            if bid is not None:
-                r["call_bid"] = float(bid)
-            if ask is not None:
-                r["call_ask"] = float(ask)
-            if delta is not None:
-                try:
-                    r["call_delta"] = float(delta)
-                except Exception:
-                    pass
-        # puts
-        for _, row in puts.iterrows():
-            strike = float(row.get("strike", 0.0))
-            key = (exp_str, strike)
-            r = rows_map.setdefault(
-                key,
-                {
-                    "strike": strike,
-                    "call_bid": None,
-                    "call_ask": None,
-                    "put_bid": None,
-                    "put_ask": None,
-                    "exp": exp_str,
-                    "call_delta": None,
-                    "put_delta": None,
-                },
+        # each side is a DataFrame or core's dict of column arrays; both
+        # support `name in side` and side[name].tolist(). Core zero-fills
+        # missing quotes and marks real ones in has_bid/has_ask (absent on a
+        # DataFrame, which carries NaN instead).
+        for side, cols in zip(("call", "put"), sides):
+            if "strike" not in cols:
+                continue
+            # pull each column out as a Python list once (one C-level unboxing pass)
+            # and zip them; missing columns yield None
+            n = len(cols["strike"])
+            strikes, bids, asks, deltas, has_bids, has_asks = (
+                cols[c].tolist() if c in cols else repeat(None, n)
+                for c in ("strike", "bid", "ask", "delta", "has_bid", "has_ask")
             )
-            bid = row.get("bid")
-            ask = row.get("ask")
-            delta = row.get("delta")
-            if bid is not None:
-                r["put_bid"] = float(bid)
-            if ask is not None:
-                r["put_ask"] = float(ask)
-            if delta is not None:
-                try:
-                    r["put_delta"] = float(delta)
-                except Exception:
-                    pass
-
-    for exp_str in expirations[:max_exps]:
-        process_exp(exp_str)
+            bid_key, ask_key, delta_key = f"{side}_bid", f"{side}_ask", f"{side}_delta"
+            for strike, bid, ask, delta, has_bid, has_ask in zip(
+                strikes, bids, asks, deltas, has_bids, has_asks
+            ):
+                strike = float(strike) if strike is not None else 0.0
+                key = (exp_str, strike)
+                r = rows_map.setdefault(
+                    key,
+                    {
+                        "strike": strike,
+                        "call_bid": None,
+                        "call_ask": None,
+                        "put_bid": None,
+                        "put_ask": None,
+                        "exp": exp_str,
+                        "call_delta": None,
+                        "put_delta": None,
+                    },
+                )
+                # missing quotes stay None: the table shows a blank (sorted first)
+                if bid is not None and bid == bid and has_bid is not False:
+                    r[bid_key] = float(bid)
+                if ask is not None and ask == ask and has_ask is not False:
+                    r[ask_key] = float(ask)
+                if delta is not None:
+                    try:
+                        r[delta_key] = float(delta)
+                    except Exception:
+                        pass
+
+    # one HTTP round-trip per expiration: fetch them concurrently, merge here
+    exps = list(expirations[:max_exps])
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(exps)))) as ex:
+        for exp_str, chain in zip(exps, ex.map(fetch_exp, exps)):
+            process_exp(exp_str, chain)
 
     rows = list(rows_map.values())
     rows.sort(key=lambda r: (r["exp"], r["strike"]))
+    if rows:
+        with _CHAIN_ROWS_LOCK:
+            cache = _CHAIN_ROWS_CACHE
+            for key in [k for k, (stamp, _) in cache.items() if now - stamp >= ttl]:
+                del cache[key]
+            cache[(symbol, max_exps)] = (now, rows)
     return rows
 
 
+# symbol -> (monotonic stamp, price); spot quotes are reused for PX_TTL_SECS
+PX_TTL_SECS = 5.0
+_PX_CACHE: Dict[str, Tuple[float, float]] = {}
+
+
 def fetch_underlying_price(symbol: str) -> Optional[float]:
-    """Best-effort yfinance spot price."""
+    """Best-effort yfinance spot price (cached for PX_TTL_SECS)."""
     if yf is None:
         return None
     symbol = (symbol or "").strip().upper()
     if not symbol:
         return None
-    t = yf.Ticker(symbol)
+    now = time.monotonic()
+    hit = _PX_CACHE.get(symbol)
+    if hit is not None and now - hit[0] < PX_TTL_SECS:
+        return hit[1]
+    px = _fetch_underlying_price(symbol)
+    if px is not None:
+        _PX_CACHE[symbol] = (now, px)
+    return px
+
+
+def _fetch_underlying_price(symbol: str) -> Optional[float]:
+    # fresh Ticker: a reused one keeps returning its first fast_info quote
+    t = _ticker(symbol, fresh=True)
     # Try fast_info
     try:
         fi = getattr(t, "fast_info", None)
@@ -361,6 +623,25 @@ def fetch_underlying_price(symbol: str) -> Optional[float]:
     return None
 
 
+def _compute_builder_metrics(
+    spot: float, strike: float, premium: float, dte: int, is_csp: bool
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Wheel builder returns for one contract: (breakeven, ROC %, annualized ROC %).
+    CSP: breakeven K - premium, ROC on the strike.
+    CC: no breakeven; ROC is (upside to K + premium) on spot.
+    """
+    if is_csp:
+        be = strike - premium
+        roc = (premium / strike) * 100.0 if strike > 0 else None
+    else:
+        be = None
+        max_profit = max(0.0, strike - spot) + premium
+        roc = (max_profit / spot) * 100.0 if spot > 0 else None
+    ann_roc = roc * (365.0 / dte) if roc is not None else None
+    return be, roc, ann_roc
+
+
 # =====================================================
 #  MAIN GUI
 # =====================================================
@@ -370,13 +651,21 @@ class OptionSuiteGUI(tk.Tk):
         self.title("OptionSuite GUI v5 – Spike | Buyback | Wheel Builder")
         self.geometry("1600x950")
 
-        self.base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.presets_dir = os.path.join(self.base_dir, "presets")
+        self.base_dir = _BASE_DIR
+        self.presets_dir = _PRESETS_DIR
 
         # state
-        self.tickers: List[str] = []  # global ticker list from presets/manual
-        self.scan_thread: Optional[threading.Thread] = None
-        self.scan_runner = None  # StoppableSpike instance
+        # global ticker set from presets/manual; the sorted view is rebuilt
+        # lazily by _sorted_tickers() after any mutation
+        self._ticker_set: Set[str] = set()
+        self._ticker_sorted: Optional[List[str]] = None
+        self.scan_runner: Optional[StoppableSpike] = None
+        # scan passes run here one at a time; ticks are scheduled with after()
+        self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spike-scan")
+        self._scan_after: Optional[str] = None
+        # yfinance fetches triggered from buttons run here, results come back via after()
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gui-io")
+        self.spike_logger: Optional[GuiSpikeLogger] = None
 
         self.buy_thread: Optional[threading.Thread] = None
         self.buy_runner: Optional[StoppableBuyback] = None
@@ -393,7 +682,12 @@ class OptionSuiteGUI(tk.Tk):
         self.manual_contract_exprs: List[str] = []
 
         # options chain table state (Buyback tab)
-        self.chain_rows: Dict[str, Dict[str, Any]] = {}  # Treeview iid -> row data
+        # one array per column (CHAIN_COLS); Treeview iid str(i) is row i
+        self.chain_cols: Dict[str, np.ndarray] = {}
+        self._chain_order: np.ndarray = np.empty(0, dtype=np.intp)  # row ids in display order
+        self._chain_sort_keys: Dict[Tuple[str, bool], np.ndarray] = {}  # (col, reverse) -> key
+        # bumped per fetch; a result whose stamp no longer matches is stale and dropped
+        self._chain_seq = 0
         self.chain_sort_reverse: Dict[str, bool] = {}
 
         # Wheel/CSP builder state
@@ -413,10 +707,15 @@ class OptionSuiteGUI(tk.Tk):
         self.builder_summary_text: str = ""
 
         self.builder_chain_by_exp: Dict[str, List[Dict[str, Any]]] = {}
+        self.builder_strikes_by_exp: Dict[str, np.ndarray] = {}
         self.builder_spot_cache: Dict[str, float] = {}
+        self._builder_seq = 0  # same stale-result guard as _chain_seq
+        self._recalc_after_id: Optional[str] = None
 
         if sv_ttk is not None:
             sv_ttk.set_theme("dark")
+        # Uniform row height + one font so Treeview inserts skip per-row metrics
+        ttk.Style(self).configure("Treeview", rowheight=22, font=("TkDefaultFont", 10))
 
         self.build_menu_bar()
         self.build_header()
@@ -472,11 +771,25 @@ class OptionSuiteGUI(tk.Tk):
         self.notebook.add(self.wheel_tab, text="Wheel / CSP Builder")
         self.notebook.add(self.logs_tab, text="Logs")
 
+        # Buyback tab widgets are built the first time the tab is needed
+        self._buyback_built = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         self.build_scanner_tab()
-        self.build_buyback_tab()
         self.build_wheel_tab()
         self.build_logs_tab()
 
+    def _on_tab_changed(self, _event=None) -> None:
+        if self.notebook.select() == str(self.buyback_tab):
+            self.ensure_buyback_tab()
+
+    def ensure_buyback_tab(self) -> None:
+        if self._buyback_built:
+            return
+        self._buyback_built = True
+        self.build_buyback_tab()
+        self.buy_gui_log.recent_widget = self.recent_alerts_list
+
     def build_status_bar(self) -> None:
         self.status_var = tk.StringVar(value="Ready.")
         lbl = ttk.Label(self, textvariable=self.status_var, anchor="w", padding=5)
@@ -537,7 +850,7 @@ class OptionSuiteGUI(tk.Tk):
         headers = ("Ticker", "Strike", "Exp", "Prem", "% Chg", "Vol", "Time")
         for col, label in zip(columns, headers):
             self.alert_table.heading(col, text=label)
-            self.alert_table.column(col, width=90)
+            self.alert_table.column(col, width=90, minwidth=90, stretch=False)
 
         sb = ttk.Scrollbar(table_frame, orient="vertical", command=self.alert_table.yview)
         self.alert_table.configure(yscroll=sb.set)
@@ -607,8 +920,10 @@ class OptionSuiteGUI(tk.Tk):
         self.chain_ticker_var = tk.StringVar(value="")
         ttk.Entry(fetch_row, textvariable=self.chain_ticker_var, width=12).pack(side="left", padx=4)
         ttk.Button(fetch_row, text="Fetch Options", command=self.fetch_chain).pack(side="left", padx=4)
+        ttk.Button(fetch_row, text="Force Refresh",
+                   command=lambda: self.fetch_chain(refresh=True)).pack(side="left", padx=4)
 
-        columns = ("strike", "call_bid", "call_ask", "put_bid", "put_ask", "exp")
+        columns = CHAIN_COLS
         self.chain_tree = ttk.Treeview(left, columns=columns, show="headings", height=20, selectmode="browse")
         headings = {
             "strike": "Strike",
@@ -620,7 +935,7 @@ class OptionSuiteGUI(tk.Tk):
         }
         for col in columns:
             self.chain_tree.heading(col, text=headings[col], command=lambda c=col: self.sort_chain_table(c))
-            self.chain_tree.column(col, width=90, anchor="center")
+            self.chain_tree.column(col, width=90, minwidth=90, anchor="center", stretch=False)
 
         vsb = ttk.Scrollbar(left, orient="vertical", command=self.chain_tree.yview)
         self.chain_tree.configure(yscroll=vsb.set)
@@ -698,6 +1013,8 @@ class OptionSuiteGUI(tk.Tk):
         ttk.Label(top, text="Ticker:").pack(side="left")
         ttk.Entry(top, textvariable=self.builder_symbol_var, width=12).pack(side="left", padx=4)
         ttk.Button(top, text="Fetch Chain", command=self.builder_fetch_chain).pack(side="left", padx=4)
+        ttk.Button(top, text="Force Refresh",
+                   command=lambda: self.builder_fetch_chain(refresh=True)).pack(side="left", padx=4)
 
         ttk.Label(top, text="Type:").pack(side="left", padx=(20, 4))
         rb_frame = ttk.Frame(top)
@@ -719,7 +1036,7 @@ class OptionSuiteGUI(tk.Tk):
         ttk.Label(mid, text="Strike:").pack(side="left", padx=(20, 4))
         self.builder_strike_combo = ttk.Combobox(mid, textvariable=self.builder_strike_var, width=12, state="readonly")
         self.builder_strike_combo.pack(side="left", padx=4)
-        self.builder_strike_combo.bind("<<ComboboxSelected>>", lambda e: self.builder_recalc())
+        self.builder_strike_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_recalc())
 
         ttk.Button(mid, text="Recalculate", command=self.builder_recalc).pack(side="left", padx=8)
 
@@ -777,7 +1094,7 @@ class OptionSuiteGUI(tk.Tk):
         self.log_text.pack(fill="both", expand=True)
 
         self.logger = LogRouter(self.log_text)
-        self.buy_gui_log = BuybackGuiLog(self.log_text, self.recent_alerts_list)
+        self.buy_gui_log = BuybackGuiLog(self.logger, None)
 
     # =====================================================
     #  PRESETS + TICKERS
@@ -794,42 +1111,49 @@ class OptionSuiteGUI(tk.Tk):
             return
 
         try:
+            # single pass over the file: strip once, skip blanks/comments
             with open(path, "r") as f:
-                items = [
-                    ln.strip().upper()
-                    for ln in f
-                    if ln.strip() and not ln.strip().startswith("#")
-                ]
+                items = {s.upper() for ln in f if (s := ln.strip()) and not s.startswith("#")}
         except Exception as e:
             messagebox.showerror("Preset", f"Error loading preset:\n{e}")
             return
 
-        added = 0
-        for sym in items:
-            if sym not in self.tickers:
-                self.tickers.append(sym)
-                added += 1
+        new = items - self._ticker_set
+        if new:
+            self._ticker_set |= new
+            self._ticker_sorted = None
         self.refresh_ticker_display()
-        self.logger.log(f"Loaded preset '{preset}' ({added} new symbols).")
+        self.logger.log(f"Loaded preset '{preset}' ({len(new)} new symbols).")
         self.set_status(f"Preset '{preset}' loaded.")
 
     def add_manual_ticker(self) -> None:
-        sym = self.manual_ticker.get().strip().upper()
-        if not sym:
+        # accepts one symbol or a comma/space separated list
+        syms = self.manual_ticker.get().upper().translate(_TICKER_TRANS).split()
+        if not syms:
             return
-        if sym not in self.tickers:
-            self.tickers.append(sym)
+        added = []
+        for sym in dict.fromkeys(syms):
+            if sym in self._ticker_set:
+                self.logger.log(f"{sym} already present.")
+                continue
+            self._ticker_set.add(sym)
+            added.append(sym)
+        if added:
+            self._ticker_sorted = None
             self.refresh_ticker_display()
-            self.logger.log(f"Added ticker: {sym}")
-            self.set_status(f"{sym} added.")
-        else:
-            self.logger.log(f"{sym} already present.")
+            self.logger.log(f"Added ticker: {', '.join(added)}")
+            self.set_status(f"{', '.join(added)} added.")
         self.manual_ticker.delete(0, "end")
 
+    def _sorted_tickers(self) -> List[str]:
+        if self._ticker_sorted is None:
+            self._ticker_sorted = sorted(self._ticker_set)
+        return self._ticker_sorted
+
     def refresh_ticker_display(self) -> None:
+        # one delete + one multi-element insert instead of a Tcl call per row
         self.ticker_listbox.delete(0, "end")
-        for sym in sorted(self.tickers):
-            self.ticker_listbox.insert("end", sym)
+        self.ticker_listbox.insert("end", *self._sorted_tickers())
 
     def remove_selected_ticker(self) -> None:
         selected = list(self.ticker_listbox.curselection())
@@ -839,17 +1163,18 @@ class OptionSuiteGUI(tk.Tk):
         for idx in reversed(selected):
             sym = self.ticker_listbox.get(idx)
             removed.append(sym)
-            if sym in self.tickers:
-                self.tickers.remove(sym)
+            self._ticker_set.discard(sym)
+        self._ticker_sorted = None
         self.refresh_ticker_display()
         if removed:
             self.logger.log("Removed: " + ", ".join(removed))
             self.set_status("Tickers removed.")
 
     def clear_all_tickers(self) -> None:
-        if not self.tickers:
+        if not self._ticker_set:
             return
-        self.tickers.clear()
+        self._ticker_set.clear()
+        self._ticker_sorted = None
         self.refresh_ticker_display()
         self.logger.log("Cleared all tickers.")
         self.set_status("All tickers cleared.")
@@ -866,11 +1191,11 @@ class OptionSuiteGUI(tk.Tk):
             )
             return
 
-        if not self.tickers:
+        if not self._ticker_set:
             messagebox.showwarning("Scanner", "Load a preset or add tickers first.")
             return
 
-        if self.scan_thread and self.scan_thread.is_alive():
+        if self.scan_runner and not self.scan_runner.stopped():
             messagebox.showinfo("Scanner", "Spike scanner is already running.")
             return
 
@@ -887,7 +1212,7 @@ class OptionSuiteGUI(tk.Tk):
 
         # Build SpikeConfig from GUI
         cfg = core.SpikeConfig(
-            tickers=self.tickers,
+            tickers=list(self._sorted_tickers()),
             exp_filter=cutoff_date,          # "exp ≤ days" converted to cutoff date
             kind="both",                     # both calls and puts for now
             strike_filter="",                # all strikes
@@ -903,22 +1228,52 @@ class OptionSuiteGUI(tk.Tk):
             verbose=False,
         )
 
-        gui_logger = GuiSpikeLogger(self)
-        self.scan_runner = StoppableSpike(cfg, gui_logger)
-
-        def bg():
-            self.scan_runner.run_gui_loop()
-
-        self.scan_thread = threading.Thread(target=bg, daemon=True)
-        self.scan_thread.start()
+        # One logger for the app's lifetime so its drain loop is armed once
+        if self.spike_logger is None:
+            self.spike_logger = GuiSpikeLogger(self)
+        runner = StoppableSpike(cfg, self.spike_logger)
+        self.scan_runner = runner
+        if not runner.start():
+            runner.stop()
+            return
+        self._scan_tick(runner)
 
         self.logger.log("[Scanner] Spike scanner started.")
         self.set_status("Spike Scanner running.")
 
+    def _submit_io(self, fn, on_done, *args) -> None:
+        """Run fn(*args) off the Tk thread; on_done(future) is called back on it."""
+        fut = self._io_executor.submit(fn, *args)
+        fut.add_done_callback(lambda f: self.after(0, on_done, f))
+
+    def _scan_tick(self, runner: StoppableSpike) -> None:
+        self._scan_after = None
+        if runner.stopped():
+            self.logger.log("[Spike] Scanner stopped.")
+            return
+        t0 = time.monotonic()
+        fut = self._scan_executor.submit(runner.scan_once)
+        fut.add_done_callback(lambda f: self.after(0, self._scan_done, runner, f, t0))
+
+    def _scan_done(self, runner: StoppableSpike, fut: Future, t0: float) -> None:
+        err = fut.exception()
+        if err is not None:
+            self.logger.log(f"[Spike ERROR] scan: {err}")
+        if runner.stopped():
+            self.logger.log("[Spike] Scanner stopped.")
+            return
+        wait = max(MIN_WAIT_SECS, runner.cfg.interval_secs - (time.monotonic() - t0))
+        self._scan_after = self.after(int(wait * 1000), self._scan_tick, runner)
+
     def stop_scanner(self) -> None:
         if self.scan_runner:
             self.scan_runner.stop()
             self.logger.log("[Scanner] Stop signal sent.")
+            if self._scan_after is not None:
+                # idle between passes: cancel the pending tick right away
+                self.after_cancel(self._scan_after)
+                self._scan_after = None
+                self.logger.log("[Spike] Scanner stopped.")
             self.set_status("Spike Scanner stopping...")
         else:
             self.logger.log("[Scanner] No active scanner.")
@@ -941,8 +1296,7 @@ class OptionSuiteGUI(tk.Tk):
     def copy_scanner_to_buyback_helper(self) -> None:
         """Manual button: copy global tickers into helper listbox on Buyback tab."""
         self.buy_scanner_helper.delete(0, "end")
-        for sym in sorted(self.tickers):
-            self.buy_scanner_helper.insert("end", sym)
+        self.buy_scanner_helper.insert("end", *self._sorted_tickers())
         self.logger.log("[Buyback] Copied scanner tickers into helper list.")
         self.set_status("Scanner tickers copied into Buyback helper.")
 
@@ -958,7 +1312,7 @@ class OptionSuiteGUI(tk.Tk):
     # =====================================================
     #  OPTIONS CHAIN IN BUYBACK
     # =====================================================
-    def fetch_chain(self) -> None:
+    def fetch_chain(self, refresh: bool = False) -> None:
         sym = (self.chain_ticker_var.get() or "").strip().upper()
         if not sym:
             messagebox.showwarning("Options Chain", "Enter a ticker symbol first.")
@@ -973,11 +1327,25 @@ class OptionSuiteGUI(tk.Tk):
 
         self.logger.log(f"[Chain] Fetching options for {sym} via yfinance...")
         self.set_status(f"Fetching options for {sym}...")
+        self._clear_chain_table()
+        self._chain_seq += 1
+        seq = self._chain_seq
+        self._submit_io(
+            fetch_yf_options_chain, lambda f: self._chain_loaded(sym, seq, f), sym, 8, refresh
+        )
+
+    def _clear_chain_table(self) -> None:
         self.chain_tree.delete(*self.chain_tree.get_children())
-        self.chain_rows.clear()
+        self.chain_cols = {}
+        self._chain_order = np.empty(0, dtype=np.intp)
+        self._chain_sort_keys.clear()
 
+    def _chain_loaded(self, sym: str, seq: int, fut: Future) -> None:
+        if seq != self._chain_seq:
+            # a newer fetch was started after this one; its result wins
+            return
         try:
-            rows = fetch_yf_options_chain(sym)
+            rows = fut.result()
         except Exception as e:
             messagebox.showerror("Options Chain", f"Error fetching options:\n{e}")
             self.set_status("Options fetch error.")
@@ -988,51 +1356,78 @@ class OptionSuiteGUI(tk.Tk):
             self.set_status("No options found.")
             return
 
-        for i, r in enumerate(rows):
-            iid = str(i)
-            vals = [
-                f"{r['strike']:.2f}",
-                "" if r["call_bid"] is None else f"{r['call_bid']:.2f}",
-                "" if r["call_ask"] is None else f"{r['call_ask']:.2f}",
-                "" if r["put_bid"] is None else f"{r['put_bid']:.2f}",
-                "" if r["put_ask"] is None else f"{r['put_ask']:.2f}",
+        # another load may have filled the tree since the click; start clean
+        self._clear_chain_table()
+        nan = float("nan")
+        cols = {
+            c: np.array([nan if r[c] is None else r[c] for r in rows], dtype=float)
+            for c in CHAIN_COLS[:-1]
+        }
+        cols["exp"] = np.array([r["exp"] for r in rows])
+        self.chain_cols = cols
+        self._chain_order = np.arange(len(rows), dtype=np.intp)
+
+        all_vals = [
+            (
+                _FMT_2F(r["strike"]),
+                "" if r["call_bid"] is None else _FMT_2F(r["call_bid"]),
+                "" if r["call_ask"] is None else _FMT_2F(r["call_ask"]),
+                "" if r["put_bid"] is None else _FMT_2F(r["put_bid"]),
+                "" if r["put_ask"] is None else _FMT_2F(r["put_ask"]),
                 r["exp"],
-            ]
-            self.chain_tree.insert("", "end", iid=iid, values=vals)
-            self.chain_rows[iid] = r
+            )
+            for r in rows
+        ]
+
+        # fill the tree while it is unpacked so it lays out once at the end;
+        # raw Tcl insert skips ttk.Treeview.insert's per-call option formatting.
+        # Rows go in last-to-first at index 0: ttk finds "end" by walking the
+        # sibling list, so appending is O(n) per row while index 0 is O(1).
+        tree = self.chain_tree
+        repack = _detach_packed(tree)
+        tcl_call, tree_w = tree.tk.call, str(tree)
+        try:
+            for i in range(len(rows) - 1, -1, -1):
+                iid = str(i)
+                tcl_call(tree_w, "insert", "", 0, "-id", iid, "-values", all_vals[i])
+        finally:
+            if repack is not None:
+                repack()
 
         self.logger.log(f"[Chain] Loaded {len(rows)} option rows for {sym}.")
         self.set_status(f"Options loaded for {sym}.")
 
-    def sort_chain_table(self, col: str) -> None:
-        items = list(self.chain_tree.get_children(""))
-        if not items:
-            return
+    def _chain_sort_key(self, col: str, reverse: bool) -> Optional[np.ndarray]:
+        """Ascending numeric sort key per row for (col, direction), built once per fetch."""
+        key = self._chain_sort_keys.get((col, reverse))
+        if key is None:
+            vals = self.chain_cols.get(col)
+            if vals is None:
+                return None
+            if vals.dtype.kind == "U":
+                key = np.unique(vals, return_inverse=True)[1].astype(float)
+            else:
+                # blank quotes sort first in either direction
+                key = np.where(np.isnan(vals), np.inf if reverse else -np.inf, vals)
+            if reverse:
+                key = -key
+            self._chain_sort_keys[(col, reverse)] = key
+        return key
 
+    def sort_chain_table(self, col: str) -> None:
+        idx = self._chain_order
         reverse = self.chain_sort_reverse.get(col, False)
+        key = self._chain_sort_key(col, reverse)
+        if not len(idx) or key is None:
+            return
 
-        def parse_num(s: str) -> float:
-            try:
-                return float(s)
-            except Exception:
-                return float("inf") if reverse else float("-inf")
-
-        index_map = {"strike": 0, "call_bid": 1, "call_ask": 2, "put_bid": 3, "put_ask": 4, "exp": 5}
-
-        entries: List[Tuple[Any, str]] = []
-        for iid in items:
-            vals = self.chain_tree.item(iid, "values")
-            idx = index_map[col]
-            v = vals[idx]
-            if col == "exp":
-                key = v
-            else:
-                key = parse_num(v)
-            entries.append((key, iid))
+        # sort the current display order (stable, so earlier sorts break ties)
+        order = idx[np.argsort(key[idx], kind="stable")]
+        self._chain_order = order
 
-        entries.sort(key=lambda t: t[0], reverse=reverse)
-        for index, (_, iid) in enumerate(entries):
-            self.chain_tree.move(iid, "", index)
+        move, tree_w = self.chain_tree.tk.call, str(self.chain_tree)
+        for index, i in enumerate(order.tolist()):
+            move(tree_w, "move", str(i), "", index)
 
         self.chain_sort_reverse[col] = not reverse
 
@@ -1041,22 +1436,22 @@ class OptionSuiteGUI(tk.Tk):
         sel = self.chain_tree.selection()
         if not sel:
             return
-        iid = sel[0]
-        row = self.chain_rows.get(iid)
-        if not row:
+        cols = self.chain_cols
+        i = int(sel[0])
+        if not cols or i >= len(cols["strike"]):
             return
 
         sym = (self.chain_ticker_var.get() or "").strip().upper()
         self.manual_sym_var.set(sym)
-        self.manual_strike_var.set(f"{row['strike']:.2f}")
-        self.manual_exp_var.set(row["exp"])
+        self.manual_strike_var.set(f"{cols['strike'][i]:.2f}")
+        self.manual_exp_var.set(str(cols["exp"][i]))
 
         t = (self.manual_type_var.get() or "CALL").upper()
-        if t.startswith("C"):
-            price = row["call_ask"] if row["call_ask"] is not None else row["call_bid"]
-        else:
-            price = row["put_ask"] if row["put_ask"] is not None else row["put_bid"]
-        if price is not None:
+        side = "call" if t.startswith("C") else "put"
+        price = cols[f"{side}_ask"][i]
+        if math.isnan(price):
+            price = cols[f"{side}_bid"][i]
+        if not math.isnan(price):
             self.manual_open_var.set(f"{price:.2f}")
 
     # =====================================================
@@ -1199,13 +1594,10 @@ class OptionSuiteGUI(tk.Tk):
             return
 
         # parse settings
-        import re as _re
-
         try:
             targets = [
                 float(x)
-                for x in _re.split(r"[,\s]+", self.buy_targets.get().strip())
-                if x
+                for x in self.buy_targets.get().replace(",", " ").split()
             ]
         except Exception:
             messagebox.showerror("Buyback", "Invalid Targets %. Use comma- or space-separated numbers.")
@@ -1240,12 +1632,16 @@ class OptionSuiteGUI(tk.Tk):
             try:
                 runner.run_gui_loop()
             finally:
-                self.logger.log("[Buyback] Buyback monitor stopped.")
-                self.set_status("Buyback monitor stopped.")
+                # worker thread: hand the final log/status off to the Tk thread
+                self.after(0, self._buy_monitor_stopped)
 
         self.buy_thread = threading.Thread(target=bg, daemon=True)
         self.buy_thread.start()
 
+    def _buy_monitor_stopped(self) -> None:
+        self.logger.log("[Buyback] Buyback monitor stopped.")
+        self.set_status("Buyback monitor stopped.")
+
     def buy_monitor_stop(self) -> None:
         if self.buy_runner:
             self.buy_runner.stop()
@@ -1258,7 +1654,7 @@ class OptionSuiteGUI(tk.Tk):
     # =====================================================
     #  WHEEL / CSP BUILDER LOGIC
     # =====================================================
-    def builder_fetch_chain(self) -> None:
+    def builder_fetch_chain(self, refresh: bool = False) -> None:
         symbol = (self.builder_symbol_var.get() or "").strip().upper()
         if not symbol:
             messagebox.showwarning("Builder", "Enter a ticker symbol first.")
@@ -1273,8 +1669,21 @@ class OptionSuiteGUI(tk.Tk):
         self.logger.log(f"[Builder] Fetching options chain for {symbol}...")
         self.set_status(f"Fetching chain for {symbol}...")
 
+        def work():
+            return (
+                fetch_yf_options_chain(symbol, max_exps=12, refresh=refresh),
+                fetch_underlying_price(symbol),
+            )
+
+        self._builder_seq += 1
+        seq = self._builder_seq
+        self._submit_io(work, lambda f: self._builder_chain_loaded(symbol, seq, f))
+
+    def _builder_chain_loaded(self, symbol: str, seq: int, fut: Future) -> None:
+        if seq != self._builder_seq:
+            return
         try:
-            rows = fetch_yf_options_chain(symbol, max_exps=12)
+            rows, spot = fut.result()
         except Exception as e:
             messagebox.showerror("Builder", f"Error fetching options:\n{e}")
             self.set_status("Builder chain fetch error.")
@@ -1285,14 +1694,25 @@ class OptionSuiteGUI(tk.Tk):
             self.set_status("No chain data found.")
             return
 
-        # group by expiration
+        # group by expiration (rows arrive sorted by exp, strike) and keep a
+        # strike array per expiration for searchsorted lookups
         by_exp: Dict[str, List[Dict[str, Any]]] = {}
         for r in rows:
             by_exp.setdefault(r["exp"], []).append(r)
-        for exp in by_exp:
-            by_exp[exp].sort(key=lambda x: x["strike"])
+        strikes_by_exp: Dict[str, np.ndarray] = {}
+        for exp, chain in by_exp.items():
+            chain.sort(key=lambda x: x["strike"])
+            strikes_by_exp[exp] = np.fromiter((r["strike"] for r in chain), dtype=float, count=len(chain))
+
+        # underlying price (before picking the default strike, which centres on it)
+        if spot is not None:
+            self.builder_spot_cache[symbol] = spot
+            self.builder_underlying_var.set(f"${spot:.2f}")
+        else:
+            self.builder_underlying_var.set("-")
 
         self.builder_chain_by_exp = by_exp
+        self.builder_strikes_by_exp = strikes_by_exp
         exps_sorted = sorted(by_exp.keys())
         self.builder_exp_combo["values"] = exps_sorted
 
@@ -1300,14 +1720,6 @@ class OptionSuiteGUI(tk.Tk):
             self.builder_exp_var.set(exps_sorted[0])
             self.builder_on_exp_change()
 
-        # underlying price
-        spot = fetch_underlying_price(symbol)
-        if spot is not None:
-            self.builder_spot_cache[symbol] = spot
-            self.builder_underlying_var.set(f"${spot:.2f}")
-        else:
-            self.builder_underlying_var.set("-")
-
         self.logger.log(f"[Builder] Loaded {len(rows)} rows across {len(by_exp)} expirations for {symbol}.")
         self.set_status(f"Builder: chain loaded for {symbol}.")
 
@@ -1316,22 +1728,26 @@ class OptionSuiteGUI(tk.Tk):
         if not exp or exp not in self.builder_chain_by_exp:
             self.builder_strike_combo["values"] = ()
             self.builder_strike_var.set("")
-            self.builder_recalc()
+            self._schedule_recalc()
             return
 
         chain = self.builder_chain_by_exp[exp]
-        strikes = [f"{r['strike']:.2f}" for r in chain]
+        strikes = [_FMT_2F(r["strike"]) for r in chain]
         self.builder_strike_combo["values"] = strikes
         if strikes:
             # pick closest-to-ATM by default
             symbol = (self.builder_symbol_var.get() or "").strip().upper()
             spot = self.builder_spot_cache.get(symbol)
             if spot is not None:
-                closest = min(chain, key=lambda r: abs(r["strike"] - spot))
-                self.builder_strike_var.set(f"{closest['strike']:.2f}")
+                # sorted strikes: compare the two neighbours of spot
+                arr = self.builder_strikes_by_exp[exp]
+                i = int(np.searchsorted(arr, spot))
+                if i == len(arr) or (i > 0 and arr[i] - spot >= spot - arr[i - 1]):
+                    i -= 1
+                self.builder_strike_var.set(strikes[i])
             else:
                 self.builder_strike_var.set(strikes[0])
-        self.builder_recalc()
+        self._schedule_recalc()
 
     def _builder_get_selected_row(self) -> Optional[Dict[str, Any]]:
         exp = self.builder_exp_var.get()
@@ -1345,9 +1761,10 @@ class OptionSuiteGUI(tk.Tk):
             strike = float(strike_s)
         except Exception:
             return None
-        for r in chain:
-            if abs(r["strike"] - strike) < 1e-6:
-                return r
+        arr = self.builder_strikes_by_exp[exp]
+        i = int(np.searchsorted(arr, strike - 1e-6))
+        if i < len(arr) and abs(arr[i] - strike) < 1e-6:
+            return chain[i]
         return None
 
     def _builder_mid_price(self, r: Dict[str, Any], is_call: bool) -> Optional[float]:
@@ -1355,12 +1772,13 @@ class OptionSuiteGUI(tk.Tk):
             bid, ask = r.get("call_bid"), r.get("call_ask")
         else:
             bid, ask = r.get("put_bid"), r.get("put_ask")
-        if bid is not None and ask is not None and bid > 0 and ask > 0:
-            return (bid + ask) / 2.0
-        if ask is not None and ask > 0:
-            return float(ask)
-        if bid is not None and bid > 0:
-            return float(bid)
+        # missing quotes count as 0 so each side needs a single > 0 test (NaN fails it too)
+        bid = 0.0 if bid is None else float(bid)
+        ask = 0.0 if ask is None else float(ask)
+        if ask > 0:
+            return (bid + ask) / 2.0 if bid > 0 else ask
+        if bid > 0:
+            return bid
         return None
 
     def _builder_delta(self, r: Dict[str, Any], is_call: bool) -> Optional[float]:
@@ -1377,8 +1795,7 @@ class OptionSuiteGUI(tk.Tk):
 
     def _builder_dte(self, exp_str: str) -> Optional[int]:
         try:
-            y, m, d = [int(x) for x in exp_str.split("-")]
-            exp_date = dt.date(y, m, d)
+            exp_date = dt.date.fromisoformat(exp_str)
             today = dt.date.today()
             dte = (exp_date - today).days
             if dte < 0:
@@ -1436,6 +1853,16 @@ class OptionSuiteGUI(tk.Tk):
 
         return max(0.0, min(100.0, base))
 
+    def _schedule_recalc(self) -> None:
+        """Debounce builder_recalc: restart the timer on every call."""
+        if self._recalc_after_id is not None:
+            self.after_cancel(self._recalc_after_id)
+        self._recalc_after_id = self.after(RECALC_DEBOUNCE_MS, self._run_scheduled_recalc)
+
+    def _run_scheduled_recalc(self) -> None:
+        self._recalc_after_id = None
+        self.builder_recalc()
+
     def builder_recalc(self) -> None:
         """Recompute all metrics based on builder state."""
         symbol = (self.builder_symbol_var.get() or "").strip().upper()
@@ -1467,12 +1894,9 @@ class OptionSuiteGUI(tk.Tk):
         is_csp = (self.builder_type_var.get() or "CSP").upper() == "CSP"
         is_call = not is_csp
 
-        # spot
+        # spot: captured by the chain fetch worker via fetch_underlying_price;
+        # recalc never goes to the network on the Tk thread
         spot = self.builder_spot_cache.get(symbol)
-        if spot is None:
-            spot = fetch_underlying_price(symbol)
-            if spot is not None:
-                self.builder_spot_cache[symbol] = spot
 
         if spot is not None:
             self.builder_underlying_var.set(f"${spot:.2f}")
@@ -1504,23 +1928,10 @@ class OptionSuiteGUI(tk.Tk):
         prob = None
 
         if premium is not None and spot is not None and dte is not None:
-            if is_csp:
-                # CSP logic
-                be = strike - premium
-                roc = (premium / strike) * 100.0 if strike > 0 else None
-                ann_roc = roc * (365.0 / dte) if roc is not None else None
-                prob = self._approx_prob_from_delta(delta, is_put=True)
-                if prob is None:
-                    prob = self._approx_prob_from_moneyness(spot, strike, is_put=True)
-            else:
-                # Covered Call logic
-                upside = max(0.0, strike - spot)
-                max_profit = upside + premium
-                roc = (max_profit / spot) * 100.0 if spot > 0 else None
-                ann_roc = roc * (365.0 / dte) if roc is not None else None
-                prob = self._approx_prob_from_delta(delta, is_put=False)
-                if prob is None:
-                    prob = self._approx_prob_from_moneyness(spot, strike, is_put=False)
+            be, roc, ann_roc = _compute_builder_metrics(spot, strike, premium, dte, is_csp)
+            prob = self._approx_prob_from_delta(delta, is_put=is_csp)
+            if prob is None:
+                prob = self._approx_prob_from_moneyness(spot, strike, is_put=is_csp)
 
         if be is not None:
             self.builder_be_var.set(f"${be:.2f}")
@@ -1603,6 +2014,7 @@ class OptionSuiteGUI(tk.Tk):
             parts.append(f"open={open_price:.2f}")
         expr = " ".join(parts)
 
+        self.ensure_buyback_tab()
         self.manual_contract_exprs.append(expr)
         self.manual_listbox.insert("end", expr)
         self.logger.log(f"[Builder] Added to Buyback: {expr}")